@@ -0,0 +1,53 @@
+"""Store a 16-byte hash of revoked token IDs and index it instead of the raw ID
+
+Revision ID: 005_hash_revoked_token_ids
+Revises: 004_update_admin_user_names
+Create Date: 2024-01-01 00:05:00.000000
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_hash_revoked_token_ids'
+down_revision = '004_update_admin_user_names'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add token_hash to revoked_tokens, backfill it and move the lookup index onto it"""
+    
+    # Add token_hash column, nullable until existing rows are backfilled
+    op.add_column('revoked_tokens',
+        sa.Column('token_hash', sa.BINARY(length=16), nullable=True, comment="blake2b-128 digest of token_id")
+    )
+    
+    # Backfill hashes for existing revocations (must match app.core.security.hash_token_id)
+    connection = op.get_bind()
+    rows = connection.execute(sa.text("SELECT id, token_id FROM revoked_tokens")).fetchall()
+    for row_id, token_id in rows:
+        connection.execute(
+            sa.text("UPDATE revoked_tokens SET token_hash = :token_hash WHERE id = :id"),
+            {"token_hash": hashlib.blake2b(token_id.encode("utf-8"), digest_size=16).digest(), "id": row_id}
+        )
+    
+    op.alter_column('revoked_tokens', 'token_hash', existing_type=sa.BINARY(length=16), nullable=False)
+    
+    # Look revocations up by the fixed-size hash instead of the VARCHAR(255) ID
+    op.create_index('ix_revoked_tokens_token_hash', 'revoked_tokens', ['token_hash'], unique=True)
+    op.drop_index('ix_revoked_tokens_token_id', table_name='revoked_tokens')
+    
+    # Per-user listings filtered by user and ordered by revocation time
+    op.create_index('ix_revoked_tokens_user_id_revoked_at', 'revoked_tokens', ['user_id', 'revoked_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Restore the token_id index and remove token_hash"""
+    
+    op.drop_index('ix_revoked_tokens_user_id_revoked_at', table_name='revoked_tokens')
+    op.create_index('ix_revoked_tokens_token_id', 'revoked_tokens', ['token_id'], unique=False)
+    op.drop_index('ix_revoked_tokens_token_hash', table_name='revoked_tokens')
+    op.drop_column('revoked_tokens', 'token_hash')
@@ -0,0 +1,52 @@
+"""Drop indexes duplicated by primary keys and unique constraints
+
+Revision ID: 006_drop_redundant_indexes
+Revises: 005_hash_revoked_token_ids
+Create Date: 2024-01-01 00:06:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_drop_redundant_indexes'
+down_revision = '005_hash_revoked_token_ids'
+branch_labels = None
+depends_on = None
+
+# Secondary indexes on primary key columns; the primary key already indexes them
+PRIMARY_KEY_INDEXES = (
+    ('ix_organizations_id', 'organizations'),
+    ('ix_users_id', 'users'),
+    ('ix_services_id', 'services'),
+    ('ix_roles_id', 'roles'),
+    ('ix_user_roles_id', 'user_roles'),
+    ('ix_subscription_tiers_id', 'subscription_tiers'),
+    ('ix_organization_subscriptions_id', 'organization_subscriptions'),
+    ('ix_revoked_tokens_id', 'revoked_tokens'),
+)
+
+# Non-unique indexes on columns that already have a unique constraint
+UNIQUE_COLUMN_INDEXES = (
+    ('ix_organizations_name', 'organizations', 'name'),
+    ('ix_users_email', 'users', 'email'),
+)
+
+
+def upgrade() -> None:
+    """Drop the duplicate indexes"""
+    
+    for index_name, table_name in PRIMARY_KEY_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+    
+    for index_name, table_name, _ in UNIQUE_COLUMN_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade() -> None:
+    """Recreate the duplicate indexes"""
+    
+    for index_name, table_name, column_name in UNIQUE_COLUMN_INDEXES:
+        op.create_index(index_name, table_name, [column_name], unique=False)
+    
+    for index_name, table_name in PRIMARY_KEY_INDEXES:
+        op.create_index(index_name, table_name, ['id'], unique=False)
@@ -0,0 +1,37 @@
+"""Store password hashes as ASCII VARCHAR(128)
+
+Revision ID: 007_narrow_password_hash
+Revises: 006_drop_redundant_indexes
+Create Date: 2024-01-01 00:07:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = '007_narrow_password_hash'
+down_revision = '006_drop_redundant_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Shrink users.password_hash to an ASCII VARCHAR(128)"""
+    
+    # bcrypt hashes are 60 characters and argon2id hashes about 97, all ASCII
+    op.alter_column('users', 'password_hash',
+        existing_type=sa.String(length=255),
+        type_=mysql.VARCHAR(length=128, charset='ascii', collation='ascii_bin'),
+        existing_nullable=False
+    )
+
+
+def downgrade() -> None:
+    """Restore users.password_hash to VARCHAR(255) in the table charset"""
+    
+    op.alter_column('users', 'password_hash',
+        existing_type=mysql.VARCHAR(length=128, charset='ascii', collation='ascii_bin'),
+        type_=sa.String(length=255),
+        existing_nullable=False
+    )
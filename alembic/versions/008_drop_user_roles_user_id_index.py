@@ -0,0 +1,27 @@
+"""Drop the user_roles.user_id index covered by the unique (user_id, role_id) constraint
+
+Revision ID: 008_drop_user_roles_user_id_index
+Revises: 007_narrow_password_hash
+Create Date: 2024-01-01 00:08:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_drop_user_roles_user_id_index'
+down_revision = '007_narrow_password_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop ix_user_roles_user_id"""
+    
+    # unique_user_role (user_id, role_id) serves user_id lookups and the foreign key
+    op.drop_index('ix_user_roles_user_id', table_name='user_roles')
+
+
+def downgrade() -> None:
+    """Recreate ix_user_roles_user_id"""
+    
+    op.create_index('ix_user_roles_user_id', 'user_roles', ['user_id'], unique=False)
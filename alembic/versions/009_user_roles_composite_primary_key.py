@@ -0,0 +1,41 @@
+"""Replace the user_roles surrogate id with a (user_id, role_id) primary key
+
+Revision ID: 009_user_roles_composite_primary_key
+Revises: 008_drop_user_roles_user_id_index
+Create Date: 2024-01-01 00:09:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009_user_roles_composite_primary_key'
+down_revision = '008_drop_user_roles_user_id_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Make (user_id, role_id) the primary key and drop id and unique_user_role"""
+    
+    # One statement: MySQL rejects dropping the key of an AUTO_INCREMENT column on its own
+    op.execute(
+        "ALTER TABLE user_roles "
+        "DROP PRIMARY KEY, "
+        "DROP COLUMN id, "
+        "ADD PRIMARY KEY (user_id, role_id)"
+    )
+    
+    # The primary key now enforces uniqueness and backs the users foreign key
+    op.drop_constraint('unique_user_role', 'user_roles', type_='unique')
+
+
+def downgrade() -> None:
+    """Restore the surrogate id primary key and unique_user_role"""
+    
+    op.create_unique_constraint('unique_user_role', 'user_roles', ['user_id', 'role_id'])
+    op.execute(
+        "ALTER TABLE user_roles "
+        "DROP PRIMARY KEY, "
+        "ADD COLUMN id BIGINT NOT NULL AUTO_INCREMENT FIRST, "
+        "ADD PRIMARY KEY (id)"
+    )
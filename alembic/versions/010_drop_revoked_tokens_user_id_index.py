@@ -0,0 +1,28 @@
+"""Drop the revoked_tokens.user_id index covered by the (user_id, revoked_at) index
+
+Revision ID: 010_drop_revoked_tokens_user_id_index
+Revises: 009_user_roles_composite_primary_key
+Create Date: 2024-01-01 00:10:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010_drop_revoked_tokens_user_id_index'
+down_revision = '009_user_roles_composite_primary_key'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop ix_revoked_tokens_user_id"""
+    
+    # ix_revoked_tokens_user_id_revoked_at leads with user_id, so it serves
+    # user_id lookups and the foreign key
+    op.drop_index('ix_revoked_tokens_user_id', table_name='revoked_tokens')
+
+
+def downgrade() -> None:
+    """Recreate ix_revoked_tokens_user_id"""
+    
+    op.create_index('ix_revoked_tokens_user_id', 'revoked_tokens', ['user_id'], unique=False)
@@ -15,7 +15,7 @@ from app.core.config import get_settings
 from app.core.database import get_database_session, SessionLocal
 from app.core.logging import get_logger, log_request_info, log_response_info
 from app.core.security import verify_token, is_suspicious_activity
-from app.models.user import User
+from app.models.user import User, USER_BY_ID
 
 # Get settings and logger
 settings = get_settings()
@@ -124,7 +124,7 @@ def get_current_user(
             )
         
         # Get user from database
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.execute(USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -13,18 +13,18 @@ from app.api.deps import get_db, get_current_user
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.core.security import (
-    get_password_hash,
-    verify_password,
+    aget_password_hash,
+    averify_password,
     create_access_token,
     create_refresh_token,
+    needs_rehash,
     verify_token
 )
 from app.core.email import EmailService
-from app.models.user import User
+from app.core.login_activity import record_login
+from app.models.user import User, USER_BY_EMAIL, USER_BY_ID, with_context
 from app.models.organization import Organization
 from app.models.service import Service
-from app.models.user_role import UserRole
-from app.models.role import Role
 from app.models.organization_subscription import OrganizationSubscription
 from app.schemas.auth import (
     UserCreate,
@@ -32,6 +32,7 @@ from app.schemas.auth import (
     UserResponse,
     TokenResponse,
     RefreshTokenRequest,
+    UserProfilePayload,
     UserProfileResponse
 )
 
@@ -42,6 +43,11 @@ logger = get_logger(__name__)
 # Create router
 router = APIRouter()
 
+# Profile fields read straight off the loaded User (everything but roles and subscriptions)
+_PROFILE_USER_ATTRIBUTES = tuple(
+    name for name in UserProfilePayload.model_fields if name not in ("roles", "subscriptions")
+)
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -62,7 +68,7 @@ async def register(
         HTTPException: If registration fails
     """
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = db.execute(USER_BY_EMAIL, {"email": user_data.email}).scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -86,7 +92,7 @@ async def register(
     
     try:
         # Create new user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await aget_password_hash(user_data.password)
         
         new_user = User(
             org_id=user_data.org_id,
@@ -168,9 +174,9 @@ async def login(
         HTTPException: If authentication fails
     """
     # Find user by email
-    user = db.query(User).filter(User.email == user_credentials.email).first()
+    user = db.execute(USER_BY_EMAIL, {"email": user_credentials.email}).scalar_one_or_none()
     
-    if not user or not verify_password(user_credentials.password, user.password_hash):
+    if not user or not await averify_password(user_credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -182,9 +188,14 @@ async def login(
             detail="Account is inactive"
         )
     
-    # Update last login
-    user.update_last_login()
-    db.commit()
+    # Upgrade bcrypt or outdated argon2 hashes while the plain password is at hand
+    if needs_rehash(user.password_hash):
+        user.password_hash = await aget_password_hash(user_credentials.password)
+        db.commit()
+        logger.info("Password hash upgraded to current argon2 parameters", user_id=user.id)
+    
+    # Update last login (written in batches off the request path)
+    record_login(user.id)
     
     # Create access and refresh tokens
     access_token = create_access_token(
@@ -252,7 +263,7 @@ async def refresh_token(
             )
         
         # Get user
-        user = db.query(User).filter(User.id == int(user_id)).first()
+        user = db.execute(USER_BY_ID, {"user_id": int(user_id)}).scalar_one_or_none()
         if not user or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -293,29 +304,13 @@ async def get_current_user_profile(
         UserProfileResponse: User profile with full details
     """
     try:
-        # Get user's organization with full details
-        organization = db.query(Organization).filter(Organization.id == current_user.org_id).first()
+        # Load the user's organization and roles with their services up front
+        user = db.execute(
+            with_context(USER_BY_ID), {"user_id": current_user.id}
+        ).scalar_one()
         
         # Get user's roles with service details
-        user_roles = db.query(UserRole).filter(UserRole.user_id == current_user.id).all()
-        roles = []
-        for user_role in user_roles:
-            role = db.query(Role).options(
-                joinedload(Role.service)
-            ).filter(Role.id == user_role.role_id).first()
-            if role:
-                roles.append({
-                    "id": role.id,
-                    "name": role.name,
-                    "service_id": role.service_id,
-                    "permissions": role.permissions,
-                    "service": {
-                        "id": role.service.id,
-                        "name": role.service.name,
-                        "description": role.service.description,
-                        "status": role.service.status
-                    }
-                })
+        roles = [user_role.role for user_role in user.user_roles if user_role.role]
         
         # Get organization subscriptions with full service and tier details
         subscriptions = db.query(OrganizationSubscription).options(
@@ -326,51 +321,19 @@ async def get_current_user_profile(
             OrganizationSubscription.is_active == True
         ).all()
         
-        subscription_info = []
-        for sub in subscriptions:
-            subscription_info.append({
-                "id": sub.id,
-                "service_id": sub.service_id,
-                "tier_id": sub.tier_id,
-                "start_date": sub.start_date.isoformat() if sub.start_date else None,
-                "end_date": sub.end_date.isoformat() if sub.end_date else None,
-                "is_active": sub.is_active,
-                "service": {
-                    "id": sub.service.id,
-                    "name": sub.service.name,
-                    "description": sub.service.description,
-                    "status": sub.service.status
-                },
-                "tier": {
-                    "id": sub.tier.id,
-                    "service_id": sub.tier.service_id,
-                    "tier_name": sub.tier.tier_name,
-                    "features": sub.tier.features
-                }
-            })
-        
-        # Prepare organization details
-        organization_details = None
-        if organization:
-            organization_details = {
-                "id": organization.id,
-                "name": organization.name,
-                "created_at": organization.created_at.isoformat() if organization.created_at else None,
-                "updated_at": organization.updated_at.isoformat() if organization.updated_at else None
-            }
-        
-        # Prepare complete user data with all details
-        user_data = current_user.to_dict()
-        user_data.update({
+        # Validate once from the loaded ORM graph: user columns and organization are
+        # read as attributes, while roles and subscriptions are not User attributes
+        # and are passed in; nested detail schemas read their ORM objects (from_attributes)
+        user_data = UserProfilePayload.model_validate({
+            **{name: getattr(user, name) for name in _PROFILE_USER_ATTRIBUTES},
             "roles": roles,
-            "organization": organization_details,
-            "subscriptions": subscription_info
+            "subscriptions": subscriptions,
         })
         
         logger.info("Retrieved user profile with full details", 
                    user_id=current_user.id,
                    roles_count=len(roles),
-                   subscriptions_count=len(subscription_info))
+                   subscriptions_count=len(subscriptions))
         
         return UserProfileResponse(user=user_data)
         
@@ -421,7 +384,7 @@ async def verify_email(
             )
         
         # Find user
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.execute(USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -4,7 +4,7 @@ Includes service status, database connectivity, and system information
 """
 
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -51,7 +51,7 @@ async def health_check(db: Session = Depends(get_db)) -> Any:
         # Create health check response
         health_data = HealthCheck(
             status="healthy" if db_status == "healthy" else "degraded",
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
             version=settings.app_version,
             environment=settings.environment,
             database={
@@ -77,7 +77,7 @@ async def health_check(db: Session = Depends(get_db)) -> Any:
         # Return degraded status on error
         return HealthCheck(
             status="degraded",
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
             version=settings.app_version,
             environment=settings.environment,
             database={
@@ -215,7 +215,7 @@ async def detailed_health_check() -> dict:
         
         detailed_health = {
             "status": overall_status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "service": {
                 "name": settings.app_name,
                 "version": settings.app_version,
@@ -244,7 +244,7 @@ async def detailed_health_check() -> dict:
         logger.error("Detailed health check failed", error=str(e))
         return {
             "status": "error",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "error": str(e)
         }
 
@@ -265,7 +265,7 @@ async def metrics() -> dict:
         
         # Basic metrics
         metrics_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "uptime_seconds": uptime,
             "database": {
                 "pool_size": db_info.get("pool_size", 0),
@@ -287,5 +287,5 @@ async def metrics() -> dict:
         logger.error("Metrics collection failed", error=str(e))
         return {
             "error": "Failed to collect metrics",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         } 
\ No newline at end of file
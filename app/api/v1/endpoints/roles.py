@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
 from app.models.user import User
-from app.models.role import Role
+from app.models.role import Role, ROLE_LIST
 from app.models.service import Service
 from app.schemas.role import RoleCreate, RoleUpdate, RoleResponse
 from app.core.logging import get_logger
@@ -31,11 +31,11 @@ def get_roles(
     # TODO: Add service_admin and super_admin role checks
     # For now, allowing any authenticated user
     
-    query = db.query(Role)
+    query = ROLE_LIST
     if service_id:
-        query = query.filter(Role.service_id == service_id)
+        query = query.where(Role.service_id == service_id)
     
-    roles = query.all()
+    roles = db.execute(query).all()
     return roles
 
 
@@ -9,8 +9,9 @@ from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
 from app.core.logging import get_logger
+from app.core.security import hash_token_id
 from app.models.user import User
-from app.models.revoked_token import RevokedToken
+from app.models.revoked_token import RevokedToken, REVOKED_TOKEN_ID_BY_HASH
 from app.schemas.token import TokenRevokeRequest, RevokedTokenResponse
 
 # Get logger
@@ -34,9 +35,10 @@ def revoke_token(
     # For now, allowing any authenticated user
     
     # Check if token is already revoked
-    existing_revoked_token = db.query(RevokedToken).filter(
-        RevokedToken.token_id == token_data.token_id
-    ).first()
+    token_hash = hash_token_id(token_data.token_id)
+    existing_revoked_token = db.execute(
+        REVOKED_TOKEN_ID_BY_HASH, {"token_hash": token_hash}
+    ).scalar_one_or_none()
     if existing_revoked_token:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -46,6 +48,7 @@ def revoke_token(
     # Create revoked token record
     revoked_token = RevokedToken(
         token_id=token_data.token_id,
+        token_hash=token_hash,
         user_id=current_user.id  # Assuming the current user is revoking the token
     )
     
@@ -74,5 +77,4 @@ def get_tokens(
     if user_id:
         query = query.filter(RevokedToken.user_id == user_id)
     
-    tokens = query.all()
-    return tokens
\ No newline at end of file
+    return [RevokedTokenResponse.from_orm_trusted(token) for token in query.all()]
\ No newline at end of file
@@ -7,9 +7,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
-from app.models.user import User
+from app.models.user import User, USER_BY_ID, USER_LIST
 from app.models.organization import Organization
-from app.models.user_role import UserRole
+from app.models.user_role import UserRole, bulk_insert_user_roles
 from app.models.role import Role
 from app.schemas.user import UserUpdate, UserResponse
 from app.core.logging import get_logger
@@ -30,8 +30,7 @@ def get_users(
     # TODO: Add org_admin and super_admin role checks
     # For now, allowing any authenticated user
     
-    users = db.query(User).all()
-    return users
+    return [UserResponse.from_orm_trusted(row) for row in db.execute(USER_LIST)]
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -47,14 +46,14 @@ def get_user(
     # TODO: Add org_admin and super_admin role checks
     # For now, allowing any authenticated user
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.execute(USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    return user
+    return UserResponse.from_orm_trusted(user)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -71,7 +70,7 @@ def update_user(
     # TODO: Add org_admin and super_admin role checks
     # For now, allowing any authenticated user
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.execute(USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -107,9 +106,7 @@ def update_user(
         db.query(UserRole).filter(UserRole.user_id == user_id).delete()
         
         # Add new user roles
-        for role_id in user_data.roles:
-            user_role = UserRole(user_id=user_id, role_id=role_id)
-            db.add(user_role)
+        bulk_insert_user_roles(db, user_id, user_data.roles)
     
     db.commit()
     db.refresh(user)
@@ -131,7 +128,7 @@ def delete_user(
     # TODO: Add org_admin and super_admin role checks
     # For now, allowing any authenticated user
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.execute(USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
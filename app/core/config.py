@@ -28,6 +28,10 @@ class Settings(BaseSettings):
     algorithm: str = Field(default="HS256", env="ALGORITHM")
     access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(default=7, env="REFRESH_TOKEN_EXPIRE_DAYS")
+    argon2_time_cost: int = Field(default=3, env="ARGON2_TIME_COST")
+    argon2_memory_cost: int = Field(default=65536, env="ARGON2_MEMORY_COST")  # KiB
+    argon2_parallelism: int = Field(default=4, env="ARGON2_PARALLELISM")
+    password_hash_workers: Optional[int] = Field(default=None, env="PASSWORD_HASH_WORKERS")  # defaults to CPU count
     
     # Database Settings
     database_url: str = Field(..., env="DATABASE_URL")
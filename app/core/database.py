@@ -5,23 +5,44 @@ Includes SQLAlchemy setup, connection pooling, and database utilities
 
 import time
 from contextlib import contextmanager
-from typing import Generator, Optional
+from datetime import date
+from typing import Any, Dict, Generator, Optional, Tuple
 
 from sqlalchemy import create_engine, event, text, inspect
 from sqlalchemy.engine import Engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
 from app.core.config import get_settings
-from app.core.logging import get_logger, log_database_operation
+from app.core.logging import Lazy, get_logger, log_database_operation
 
 # Get settings and logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+
+class FastSerializable:
+    """
+    Serialization mixin shared by all models
+    
+    Each model lists its public columns in ``_DICT_FIELDS``; dates and datetimes
+    are returned as ISO-8601 strings, as the per-model to_dict() methods did.
+    """
+    
+    _DICT_FIELDS: Tuple[str, ...] = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert model to dictionary of its declared fields"""
+        return {field: _iso_or_value(getattr(self, field)) for field in self._DICT_FIELDS}
+
+
+def _iso_or_value(value: Any) -> Any:
+    """Return dates and datetimes as ISO-8601 strings, other values unchanged"""
+    return value.isoformat() if isinstance(value, date) else value
+
+
 # Create declarative base for models
-Base = declarative_base()
+Base = declarative_base(cls=FastSerializable)
 
 
 def create_database_engine() -> Engine:
@@ -45,7 +66,9 @@ def create_database_engine() -> Engine:
             max_overflow=settings.database_max_overflow,
             pool_pre_ping=True,  # Verify connections before use
             pool_recycle=3600,   # Recycle connections every hour
+            pool_use_lifo=True,  # Reuse the most recent connection so idle extras can time out
             echo=settings.debug,  # SQL logging in debug mode
+            query_cache_size=1200,  # Room for every statement shape the API issues
         )
         
         # Add event listeners for connection monitoring
@@ -388,7 +411,7 @@ def init_database() -> None:
             )
             
             logger.info("Database migrations completed successfully!")
-            logger.debug(f"Migration output: {result.stdout}")
+            logger.debug("Migration output", output=Lazy(lambda: result.stdout.strip()))
             
             if result.stderr:
                 logger.warning(f"Migration warnings: {result.stderr}")
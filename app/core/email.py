@@ -3,15 +3,28 @@ Email service for the AuthService
 Handles sending verification and password reset emails
 """
 
+import asyncio
+from dataclasses import asdict, dataclass
+from email.message import EmailMessage
+from email.utils import formataddr
 from pathlib import Path
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Dict, Optional
+
+import aiosmtplib
+from jinja2 import Environment, FileSystemLoader, ModuleLoader, select_autoescape
 from app.core.config import get_settings
 from app.core.logging import get_logger
 
 # Get settings and logger
+# SMTP connection details never change per process, so bind them once instead
+# of repeating them on every email event
 settings = get_settings()
-logger = get_logger(__name__)
+logger = get_logger(
+    __name__,
+    server=settings.mail_host,
+    port=settings.mail_port,
+    mail_from=settings.mail_from_address
+)
 
 # Email configuration
 # For SSL connections (port 465), we should use SSL_TLS and disable STARTTLS
@@ -19,43 +32,198 @@ logger = get_logger(__name__)
 use_starttls = False  # Disable STARTTLS for SSL connections
 use_ssl_tls = settings.mail_use_ssl  # Use SSL/TLS
 
-email_config = ConnectionConfig(
-    MAIL_USERNAME=settings.mail_username,
-    MAIL_PASSWORD=settings.mail_password,
-    MAIL_FROM=settings.mail_from_address or "noreply@authservice.com",
-    MAIL_PORT=settings.mail_port,
-    MAIL_SERVER=settings.mail_host,
-    MAIL_FROM_NAME=settings.mail_from_name,
-    MAIL_STARTTLS=use_starttls,
-    MAIL_SSL_TLS=use_ssl_tls,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=False  # Disable certificate validation for FleetPay server
-)
+# "From" header is identical for every email, so format it once
+_FROM_HEADER = formataddr((
+    settings.mail_from_name,
+    settings.mail_from_address or "noreply@authservice.com"
+))
 
 # Log email configuration (without password)
 logger.info("Email configuration loaded", 
-           server=settings.mail_host,
-           port=settings.mail_port,
            username=settings.mail_username,
            from_email=settings.mail_from_address,
            from_name=settings.mail_from_name,
            config_use_tls=settings.mail_use_tls,
            config_use_ssl=settings.mail_use_ssl,
-           fastapi_mail_starttls=use_starttls,
-           fastapi_mail_ssl_tls=use_ssl_tls,
+           smtp_starttls=use_starttls,
+           smtp_ssl_tls=use_ssl_tls,
                        )
 
-# Initialize FastMail
-fastmail = FastMail(email_config)
+# Concurrent sends allowed per recipient domain, so one throttling provider
+# cannot hold up mail to every other provider
+PROVIDER_CAPS: Dict[str, int] = {
+    "gmail.com": 15,
+    "googlemail.com": 15,
+    "zoho.com": 5,
+    "zohomail.com": 5,
+}
+DEFAULT_PROVIDER_CAP = 3
+
+# SMTP replies treated as temporary throttling and retried with backoff.
+# 421/450 are transient and get up to _MAX_SEND_ATTEMPTS tries. 554 is formally
+# a permanent failure, but some providers send it while throttling, so it
+# gets exactly one retry.
+_RETRYABLE_SMTP_CODES = frozenset({421, 450, 554})
+_SINGLE_RETRY_SMTP_CODES = frozenset({554})
+_MAX_SEND_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 1.0  # seconds, doubled after each failed attempt
+
+# Limiters exist only for the known providers; every other domain shares one,
+# so user-supplied recipient domains cannot grow this mapping
+_provider_semaphores: Dict[str, asyncio.Semaphore] = {
+    domain: asyncio.Semaphore(cap) for domain, cap in PROVIDER_CAPS.items()
+}
+_default_semaphore = asyncio.Semaphore(DEFAULT_PROVIDER_CAP)
+
+
+def _get_domain_semaphore(to_email: str) -> asyncio.Semaphore:
+    """Get the concurrency limiter for the recipient's email domain"""
+    domain = to_email.rsplit("@", 1)[-1].lower()
+    return _provider_semaphores.get(domain, _default_semaphore)
+
+
+def _max_attempts(smtp_code: int) -> int:
+    """Number of send attempts allowed for an SMTP error reply"""
+    if smtp_code not in _RETRYABLE_SMTP_CODES:
+        return 1
+    if smtp_code in _SINGLE_RETRY_SMTP_CODES:
+        return 2
+    return _MAX_SEND_ATTEMPTS
+
+
+async def _send_html_email(to_email: str, subject: str, html_content: str) -> None:
+    """Build an HTML email and send it over SMTP"""
+    message = EmailMessage()
+    message["From"] = _FROM_HEADER
+    message["Subject"] = subject
+    message["To"] = to_email
+    message.set_content(html_content, subtype="html")
+    
+    semaphore = _get_domain_semaphore(to_email)
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            # Hold the domain slot only while talking to the server, not during backoff
+            async with semaphore:
+                await aiosmtplib.send(
+                    message,
+                    hostname=settings.mail_host,
+                    port=settings.mail_port,
+                    username=settings.mail_username,
+                    password=settings.mail_password,
+                    use_tls=use_ssl_tls,
+                    start_tls=use_starttls,
+                    validate_certs=False  # Disable certificate validation for FleetPay server
+                )
+            return
+        except aiosmtplib.SMTPResponseException as e:
+            if attempt >= _max_attempts(e.code):
+                raise
+            delay = _RETRY_BASE_DELAY * 2 ** (attempt - 1)
+            logger.warning("SMTP server deferred email, retrying", 
+                          email=to_email,
+                          smtp_code=e.code,
+                          attempt=attempt,
+                          retry_in=delay)
+            await asyncio.sleep(delay)
+
 
 # Jinja2 template environment
+# In production, prefer the bundle built by scripts/precompile_templates.py
+# (see Dockerfile), which skips template parsing entirely. Elsewhere always read
+# the .html sources so a stale local bundle cannot shadow template edits
 template_dir = Path(__file__).parent.parent / "templates" / "email"
+compiled_templates = template_dir.parent / "email_compiled.zip"
 jinja_env = Environment(
-    loader=FileSystemLoader(str(template_dir)),
+    loader=(
+        ModuleLoader(str(compiled_templates))
+        if settings.environment == "production" and compiled_templates.exists()
+        else FileSystemLoader(str(template_dir))
+    ),
     autoescape=select_autoescape(['html', 'xml'])
 )
 
+# Templates rendered by EmailService, loaded ahead of time by warm_up_email_templates
+EMAIL_TEMPLATES = (
+    "verification.html",
+    "password_reset.html",
+    "welcome.html",
+    "password_changed.html",
+    "account_locked.html",
+)
+
+
+def warm_up_email_templates() -> None:
+    """Load every email template into the Jinja cache so the first email skips it"""
+    for name in EMAIL_TEMPLATES:
+        try:
+            jinja_env.get_template(name)
+        except Exception as e:
+            logger.warning("Failed to preload email template", template=name, error=str(e))
+
+# Fallback templates used when the Jinja2 templates cannot be rendered.
+# app_name is fixed for the lifetime of the process, so it is substituted once
+# here and only the per-user fields are filled in on each call.
+_APP_NAME = settings.app_name.replace("{", "{{").replace("}", "}}")
+
+_DEFAULT_VERIFICATION_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Vérifiez votre e-mail - {app_name}</title>
+        </head>
+        <body>
+            <h1>Bonjour {{firstname}} {{lastname}}!</h1>
+            <p>Bienvenue sur {app_name}! Veuillez vérifier votre adresse e-mail.</p>
+            <p><a href="{{verification_url}}">Vérifier l'adresse e-mail</a></p>
+            <p>Si le lien ne fonctionne pas, copiez et collez ceci dans votre navigateur : {{verification_url}}</p>
+        </body>
+        </html>
+        """.format(app_name=_APP_NAME)
+
+_DEFAULT_PASSWORD_RESET_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Réinitialisez votre mot de passe - {app_name}</title>
+        </head>
+        <body>
+            <h1>Bonjour {{firstname}} {{lastname}}!</h1>
+            <p>Nous avons reçu une demande de réinitialisation de votre mot de passe pour votre compte {app_name}.</p>
+            <p><a href="{{reset_url}}">Réinitialiser le mot de passe</a></p>
+            <p>Si le lien ne fonctionne pas, copiez et collez ceci dans votre navigateur : {{reset_url}}</p>
+        </body>
+        </html>
+        """.format(app_name=_APP_NAME)
+
+_DEFAULT_WELCOME_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Welcome to {app_name} - Your Login Credentials</title>
+        </head>
+        <body>
+            <h1>Welcome {{firstname}} {{lastname}}!</h1>
+            <p>Your account on {app_name} has been created successfully.</p>
+            <h2>Your Login Credentials:</h2>
+            <p><strong>Name:</strong> {{firstname}} {{lastname}}</p>
+            <p><strong>Email:</strong> {{email}}</p>
+            <p><strong>Password:</strong> {{password}}</p>
+            <p><a href="{{login_url}}">Login Now</a></p>
+            <p><strong>Important:</strong> Keep these credentials safe and don't share them with anyone.</p>
+        </body>
+        </html>
+        """.format(app_name=_APP_NAME)
+
 
+@dataclass
+class SendContext:
+    """Fields gathered while building an email, logged once when the send finishes"""
+    user_id: str
+    email: str
+    subject: Optional[str] = None
+    content_length: Optional[int] = None
 
 
 class EmailService:
@@ -82,20 +250,12 @@ class EmailService:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
+        ctx = SendContext(user_id=user_id, email=to_email)
         try:
-            logger.info("Starting email verification send", 
-                       user_id=user_id,
-                       email=to_email,
-                       firstname=firstname,
-                       lastname=lastname)
-            
-            subject = "Vérifiez votre adresse e-mail"
+            ctx.subject = subject = "Vérifiez votre adresse e-mail"
             
             # Create verification URL
             verification_url = f"{settings.mail_verification_url}?token={verification_token}"
-            logger.debug("Verification URL created", 
-                        user_id=user_id,
-                        verification_url=verification_url)
             
             # Email content
             html_content = EmailService._get_verification_email_template(
@@ -103,45 +263,19 @@ class EmailService:
                 lastname=lastname,
                 verification_url=verification_url
             )
-            logger.debug("Email template rendered", 
-                        user_id=user_id,
-                        content_length=len(html_content))
-            
-            # Create message
-            message = MessageSchema(
-                subject=subject,
-                recipients=[to_email],
-                body=html_content,
-                subtype=MessageType.html
-            )
-            logger.debug("Message schema created", 
-                        user_id=user_id,
-                        subject=subject,
-                        recipients=[to_email])
-            
-            # Send email
-            logger.info("Attempting to send email", 
-                       user_id=user_id,
-                       email=to_email,
-                       server=settings.mail_host,
-                       port=settings.mail_port)
+            ctx.content_length = len(html_content)
             
-            await fastmail.send_message(message)
+            # Build and send message
+            await _send_html_email(to_email, subject, html_content)
             
-            logger.info("Email verification sent successfully", 
-                       user_id=user_id,
-                       email=to_email,
-                       server=settings.mail_host)
+            logger.info("Email verification sent successfully", **asdict(ctx))
             return True
             
         except Exception as e:
             logger.error("Failed to send email verification", 
-                        user_id=user_id,
-                        email=to_email,
+                        **asdict(ctx),
                         error=str(e),
-                        error_type=type(e).__name__,
-                        server=settings.mail_host,
-                        port=settings.mail_port)
+                        error_type=type(e).__name__)
             return False
     
     @staticmethod
@@ -178,16 +312,8 @@ class EmailService:
                 reset_url=reset_url
             )
             
-            # Create message
-            message = MessageSchema(
-                subject=subject,
-                recipients=[to_email],
-                body=html_content,
-                subtype=MessageType.html
-            )
-            
-            # Send email
-            await fastmail.send_message(message)
+            # Build and send message
+            await _send_html_email(to_email, subject, html_content)
             
             logger.info("Password reset email sent successfully", 
                        user_id=user_id,
@@ -222,14 +348,9 @@ class EmailService:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
+        ctx = SendContext(user_id=user_id, email=to_email)
         try:
-            logger.info("Starting welcome email send", 
-                       user_id=user_id,
-                       email=to_email,
-                       firstname=firstname,
-                       lastname=lastname)
-            
-            subject = "Bienvenue sur " + settings.app_name + " - Vos identifiants de connexion"
+            ctx.subject = subject = "Bienvenue sur " + settings.app_name + " - Vos identifiants de connexion"
             
             # Create login URL
             login_url = settings.mail_login_url
@@ -242,47 +363,19 @@ class EmailService:
                 password=password,
                 login_url=login_url
             )
+            ctx.content_length = len(html_content)
             
-            logger.debug("Welcome email template rendered", 
-                        user_id=user_id,
-                        content_length=len(html_content))
-            
-            # Create message
-            message = MessageSchema(
-                subject=subject,
-                recipients=[to_email],
-                body=html_content,
-                subtype=MessageType.html
-            )
-            
-            logger.debug("Welcome message schema created", 
-                        user_id=user_id,
-                        subject=subject,
-                        recipients=[to_email])
-            
-            # Send email
-            logger.info("Attempting to send welcome email", 
-                       user_id=user_id,
-                       email=to_email,
-                       server=settings.mail_host,
-                       port=settings.mail_port)
+            # Build and send message
+            await _send_html_email(to_email, subject, html_content)
             
-            await fastmail.send_message(message)
-            
-            logger.info("Welcome email sent successfully", 
-                       user_id=user_id,
-                       email=to_email,
-                       server=settings.mail_host)
+            logger.info("Welcome email sent successfully", **asdict(ctx))
             return True
             
         except Exception as e:
             logger.error("Failed to send welcome email", 
-                       user_id=user_id,
-                       email=to_email,
+                       **asdict(ctx),
                        error=str(e),
-                       error_type=type(e).__name__,
-                       server=settings.mail_host,
-                       port=settings.mail_port)
+                       error_type=type(e).__name__)
             return False
     
     @staticmethod
@@ -367,60 +460,31 @@ class EmailService:
     @staticmethod
     def _get_default_verification_template(firstname: str, lastname: str, verification_url: str) -> str:
         """Fallback email verification template if external template fails"""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Vérifiez votre e-mail - {settings.app_name}</title>
-        </head>
-        <body>
-            <h1>Bonjour {firstname} {lastname}!</h1>
-            <p>Bienvenue sur {settings.app_name}! Veuillez vérifier votre adresse e-mail.</p>
-            <p><a href="{verification_url}">Vérifier l'adresse e-mail</a></p>
-            <p>Si le lien ne fonctionne pas, copiez et collez ceci dans votre navigateur : {verification_url}</p>
-        </body>
-        </html>
-        """
+        return _DEFAULT_VERIFICATION_TEMPLATE.format(
+            firstname=firstname,
+            lastname=lastname,
+            verification_url=verification_url
+        )
     
     @staticmethod
     def _get_default_password_reset_template(firstname: str, lastname: str, reset_url: str) -> str:
         """Fallback password reset template if external template fails"""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Réinitialisez votre mot de passe - {settings.app_name}</title>
-        </head>
-        <body>
-            <h1>Bonjour {firstname} {lastname}!</h1>
-            <p>Nous avons reçu une demande de réinitialisation de votre mot de passe pour votre compte {settings.app_name}.</p>
-            <p><a href="{reset_url}">Réinitialiser le mot de passe</a></p>
-            <p>Si le lien ne fonctionne pas, copiez et collez ceci dans votre navigateur : {reset_url}</p>
-        </body>
-        </html>
-        """
+        return _DEFAULT_PASSWORD_RESET_TEMPLATE.format(
+            firstname=firstname,
+            lastname=lastname,
+            reset_url=reset_url
+        )
     
     @staticmethod
     def _get_default_welcome_template(firstname: str, lastname: str, email: str, password: str, login_url: str) -> str:
         """Fallback welcome template if external template fails"""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Welcome to {settings.app_name} - Your Login Credentials</title>
-        </head>
-        <body>
-            <h1>Welcome {firstname} {lastname}!</h1>
-            <p>Your account on {settings.app_name} has been created successfully.</p>
-            <h2>Your Login Credentials:</h2>
-            <p><strong>Name:</strong> {firstname} {lastname}</p>
-            <p><strong>Email:</strong> {email}</p>
-            <p><strong>Password:</strong> {password}</p>
-            <p><a href="{login_url}">Login Now</a></p>
-            <p><strong>Important:</strong> Keep these credentials safe and don't share them with anyone.</p>
-        </body>
-        </html>
-        """
+        return _DEFAULT_WELCOME_TEMPLATE.format(
+            firstname=firstname,
+            lastname=lastname,
+            email=email,
+            password=password,
+            login_url=login_url
+        )
     
     @staticmethod
     async def send_password_changed(
@@ -446,14 +510,8 @@ class EmailService:
                 device_info=device_info
             )
             
-            message = MessageSchema(
-                subject=subject,
-                recipients=[to_email],
-                body=html_content,
-                subtype=MessageType.html
-            )
-            
-            await fastmail.send_message(message)
+            # Build and send message
+            await _send_html_email(to_email, subject, html_content)
             logger.info("Password changed email sent successfully", user_id=user_id, email=to_email)
             return True
             
@@ -503,14 +561,8 @@ class EmailService:
                 support_url=support_url
             )
             
-            message = MessageSchema(
-                subject=subject,
-                recipients=[to_email],
-                body=html_content,
-                subtype=MessageType.html
-            )
-            
-            await fastmail.send_message(message)
+            # Build and send message
+            await _send_html_email(to_email, subject, html_content)
             logger.info("Account locked email sent successfully", user_id=user_id, email=to_email)
             return True
             
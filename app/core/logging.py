@@ -3,42 +3,134 @@ Comprehensive logging configuration for the AuthService
 Includes structured logging, file rotation, and JSON formatting for production
 """
 
+import copy
 import logging
 import logging.handlers
 import os
+import queue
+import re
 import sys
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
+import orjson
 import structlog
-from pythonjsonlogger import jsonlogger
+import zstandard
 
 from app.core.config import get_settings
 
 # Get settings
 settings = get_settings()
 
+# Attributes set by logging itself; anything else on a record is an "extra" field
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
 
-class CustomJsonFormatter(jsonlogger.JsonFormatter):
-    """Custom JSON formatter with additional fields"""
+# Field names referenced by a %-style format string, e.g. "%(levelname)s"
+_FORMAT_FIELD_RE = re.compile(r"%\((.+?)\)")
+
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+# Background listener that performs the actual handler I/O (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def render_to_log_extra(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Final structlog processor: hand the event to stdlib logging as record extras
+    
+    CustomJsonFormatter then serializes the event once with orjson on the
+    listener thread, instead of structlog rendering it to a JSON string that
+    the formatter escapes and encodes a second time. Keys that clash with
+    LogRecord attributes get a trailing underscore, since logging rejects them.
+    """
+    kwargs: Dict[str, Any] = {"msg": event_dict.pop("event", "")}
+    for key in ("exc_info", "stack_info"):
+        if key in event_dict:
+            kwargs[key] = event_dict.pop(key)
+    kwargs["extra"] = {
+        (f"{key}_" if key in _RESERVED_ATTRS else key): value
+        for key, value in event_dict.items()
+    }
+    return kwargs
+
+
+class Lazy:
+    """Log value computed only if the event survives level filtering"""
+    
+    __slots__ = ("func",)
+    
+    def __init__(self, func: Callable[[], Any]) -> None:
+        self.func = func
+
+
+def resolve_lazy_values(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """structlog processor that evaluates Lazy values in the event dict"""
+    for key, value in event_dict.items():
+        if isinstance(value, Lazy):
+            event_dict[key] = value.func()
+    return event_dict
+
+
+class CustomJsonFormatter(logging.Formatter):
+    """Custom JSON formatter with additional fields, serialized with orjson"""
+    
+    def __init__(self, fmt: Optional[str] = None, *args: Any, **kwargs: Any) -> None:
+        """Initialize the formatter and cache the static service fields"""
+        super().__init__(fmt, *args, **kwargs)
+        self._required_fields = _FORMAT_FIELD_RE.findall(fmt or "")
+        self._skip_fields = _RESERVED_ATTRS.union(self._required_fields)
+        self._service = settings.app_name
+        self._version = settings.app_version
+        self._environment = settings.environment
+        # (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") for the last record seen
+        self._cached_time = (None, "")
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record as a JSON string"""
+        message_dict: Dict[str, Any] = {}
+        if isinstance(record.msg, dict):
+            message_dict = record.msg
+            record.message = ""
+        else:
+            record.message = record.getMessage()
+        
+        if record.exc_info and not message_dict.get('exc_info'):
+            message_dict['exc_info'] = self.formatException(record.exc_info)
+        if not message_dict.get('exc_info') and record.exc_text:
+            message_dict['exc_info'] = record.exc_text
+        if record.stack_info and not message_dict.get('stack_info'):
+            message_dict['stack_info'] = self.formatStack(record.stack_info)
+        
+        log_record: Dict[str, Any] = {}
+        self.add_fields(log_record, record, message_dict)
+        return orjson.dumps(log_record, default=str, option=_ORJSON_OPTIONS).decode()
     
     def add_fields(self, log_record: Dict[str, Any], record: logging.LogRecord, message_dict: Dict[str, Any]) -> None:
         """Add custom fields to the log record"""
-        super().add_fields(log_record, record, message_dict)
+        record_dict = record.__dict__
+        for field in self._required_fields:
+            log_record[field] = record_dict.get(field)
+        log_record.update(message_dict)
+        
+        # Add any extra attributes passed to the logging call
+        for key, value in record_dict.items():
+            if key not in self._skip_fields and not key.startswith('_'):
+                log_record[key] = value
         
         # Add timestamp if not present
         if not log_record.get('timestamp'):
-            log_record['timestamp'] = datetime.now().isoformat()
+            log_record['timestamp'] = self._format_created(record.created)
         
         # Ensure level is properly set
         if not log_record.get('level'):
             log_record['level'] = record.levelname
         
         # Add service information
-        log_record['service'] = settings.app_name
-        log_record['version'] = settings.app_version
-        log_record['environment'] = record.environment if hasattr(record, 'environment') else settings.environment
+        log_record['service'] = self._service
+        log_record['version'] = self._version
+        log_record['environment'] = getattr(record, 'environment', self._environment)
         
         # Add process and thread information
         log_record['process_id'] = record.process
@@ -57,55 +149,120 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         # Add task name if available (for async operations)
         if hasattr(record, 'taskName'):
             log_record['taskName'] = record.taskName
+    
+    def _format_created(self, created: float) -> str:
+        """Format a record creation time as a local ISO 8601 timestamp"""
+        seconds = int(created)
+        cached_seconds, prefix = self._cached_time
+        if seconds != cached_seconds:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+            self._cached_time = (seconds, prefix)
+        return f"{prefix}.{int((created - seconds) * 1_000_000):06d}"
+
+
+class CompressingTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """Timed rotating file handler that zstd-compresses rotated files in the background"""
+    
+    compression_level = 3
+    
+    def rotator(self, source: str, dest: str) -> None:
+        """Rename the active log file and hand it off to a compression thread"""
+        if os.path.exists(source):
+            os.rename(source, dest)
+            threading.Thread(
+                target=self._compress,
+                args=(dest,),
+                name="log-compressor",
+                daemon=True
+            ).start()
+    
+    def _compress(self, path: str) -> None:
+        """Compress a rotated log file to <path>.zst and remove the original"""
+        tmp_path = f"{path}.zst.tmp"
+        try:
+            compressor = zstandard.ZstdCompressor(level=self.compression_level)
+            with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+                compressor.copy_stream(src, dst)
+            os.replace(tmp_path, f"{path}.zst")
+            os.remove(path)
+        except OSError:
+            # Keep the uncompressed file rather than lose log data
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener thread"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments now so later mutation cannot change the message"""
+        record = copy.copy(record)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
 
 
 def setup_logging() -> None:
     """Setup comprehensive logging configuration"""
+    global _queue_listener
+    
+    # Stop the listener of a previous configuration before replacing handlers
+    shutdown_logging()
     
     # Create logs directory if it doesn't exist
     if settings.log_file_path:
         log_dir = Path(settings.log_file_path).parent
         log_dir.mkdir(parents=True, exist_ok=True)
     
+    level = getattr(logging, settings.log_level)
+    
+    # One JSON formatter is shared by every handler; they all run on the listener thread
+    json_formatter = CustomJsonFormatter(
+        '%(timestamp)s %(levelname)s %(name)s %(message)s'
+    )
+    
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, settings.log_level))
+    root_logger.setLevel(level)
     
     # Clear existing handlers
     root_logger.handlers.clear()
     
     # Console handler with structured formatting
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, settings.log_level))
+    console_handler.setLevel(level)
     
     if settings.log_format.lower() == "json":
-        console_formatter = CustomJsonFormatter(
-            '%(timestamp)s %(level)s %(name)s %(message)s'
-        )
+        console_formatter = json_formatter
     else:
         console_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(level)s - %(message)s'
         )
     
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
-    # File handler with rotation if log file path is specified
+    # File handler with daily rotation if log file path is specified;
+    # rotated files are compressed with zstd off the logging thread
     if settings.log_file_path:
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = CompressingTimedRotatingFileHandler(
             settings.log_file_path,
-            maxBytes=100 * 1024 * 1024,  # 100MB
-            backupCount=5,
+            when="midnight",
+            backupCount=14,
             encoding='utf-8'
         )
-        file_handler.setLevel(getattr(logging, settings.log_level))
+        file_handler.setLevel(level)
         
         # Always use JSON format for file logging
-        file_formatter = CustomJsonFormatter(
-            '%(timestamp)s %(levelname)s %(name)s %(message)s'
-        )
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(json_formatter)
+        handlers.append(file_handler)
+    
+    # Request threads only enqueue records; a background thread does the writes
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(LogQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     # Configure third-party loggers to reduce noise
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -116,7 +273,11 @@ def setup_logging() -> None:
     # Configure structlog for structured logging
     structlog.configure(
         processors=[
+            # Drop filtered events before any Lazy value is evaluated
             structlog.stdlib.filter_by_level,
+            resolve_lazy_values,
+            # Request-scoped values such as request_id, bound once per request
+            structlog.contextvars.merge_contextvars,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
@@ -124,7 +285,7 @@ def setup_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            render_to_log_extra
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -133,15 +294,44 @@ def setup_logging() -> None:
     )
 
 
-def get_logger(name: str) -> structlog.BoundLogger:
-    """Get a structured logger instance"""
-    return structlog.get_logger(name)
+def shutdown_logging() -> None:
+    """
+    Flush queued log records and stop the background logging thread
+    
+    The output handlers are moved back onto the root logger so records logged
+    after shutdown (e.g. uvicorn's own shutdown lines) are still written.
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        listener, _queue_listener = _queue_listener, None
+        listener.stop()
+        
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, LogQueueHandler):
+                root_logger.removeHandler(handler)
+        for handler in listener.handlers:
+            root_logger.addHandler(handler)
+
+
+def get_logger(name: str, **initial_values: Any) -> structlog.BoundLogger:
+    """Get a structured logger instance, optionally pre-bound with context values"""
+    return structlog.get_logger(name, **initial_values)
+
+
+# Loggers for the log_* helpers below, created once instead of per call
+_request_logger = get_logger("request")
+_response_logger = get_logger("response")
+_auth_logger = get_logger("auth")
+_security_logger = get_logger("security")
+_database_logger = get_logger("database")
+_external_service_logger = get_logger("external_service")
 
 
 def log_request_info(request_id: str, method: str, url: str, client_ip: str, user_agent: str) -> None:
     """Log request information for monitoring"""
-    logger = get_logger("request")
-    logger.info(
+    _request_logger.info(
         "Incoming request",
         request_id=request_id,
         method=method,
@@ -153,8 +343,7 @@ def log_request_info(request_id: str, method: str, url: str, client_ip: str, use
 
 def log_response_info(request_id: str, status_code: int, response_time: float) -> None:
     """Log response information for monitoring"""
-    logger = get_logger("response")
-    logger.info(
+    _response_logger.info(
         "Response sent",
         request_id=request_id,
         status_code=status_code,
@@ -164,10 +353,8 @@ def log_response_info(request_id: str, status_code: int, response_time: float) -
 
 def log_auth_event(event_type: str, user_id: Optional[str] = None, details: Optional[Dict[str, Any]] = None) -> None:
     """Log authentication events for security monitoring"""
-    logger = get_logger("auth")
     log_data = {
-        "event_type": event_type,
-        "timestamp": datetime.now().isoformat()
+        "event_type": event_type
     }
     
     if user_id:
@@ -176,26 +363,23 @@ def log_auth_event(event_type: str, user_id: Optional[str] = None, details: Opti
     if details:
         log_data.update(details)
     
-    logger.info("Authentication event", **log_data)
+    _auth_logger.info("Authentication event", **log_data)
 
 
 def log_security_event(event_type: str, severity: str, details: Dict[str, Any]) -> None:
     """Log security events for threat detection"""
-    logger = get_logger("security")
     log_data = {
         "event_type": event_type,
         "severity": severity,
-        "timestamp": datetime.now().isoformat(),
         **details
     }
     
-    logger.warning("Security event detected", **log_data)
+    _security_logger.warning("Security event detected", **log_data)
 
 
 def log_database_operation(operation: str, table: str, duration: float, success: bool) -> None:
     """Log database operations for performance monitoring"""
-    logger = get_logger("database")
-    logger.info(
+    _database_logger.info(
         "Database operation",
         operation=operation,
         table=table,
@@ -206,8 +390,7 @@ def log_database_operation(operation: str, table: str, duration: float, success:
 
 def log_external_service_call(service: str, endpoint: str, duration: float, status_code: int, success: bool) -> None:
     """Log external service calls for monitoring"""
-    logger = get_logger("external_service")
-    logger.info(
+    _external_service_logger.info(
         "External service call",
         service=service,
         endpoint=endpoint,
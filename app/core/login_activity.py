@@ -0,0 +1,149 @@
+"""
+Login activity recording for the AuthService
+Buffers last-login timestamps and writes them to the database in batches
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, update
+
+from app.core.database import get_db_session
+from app.core.logging import get_logger
+from app.models.user import User
+
+# Get logger
+logger = get_logger(__name__)
+
+# Core UPDATE by primary key; unlike an ORM bulk update it does not check the
+# matched row count, so a user deleted since logging in cannot fail the batch
+_users_table = User.__table__
+_UPDATE_LAST_LOGIN = (
+    update(_users_table)
+    .where(_users_table.c.id == bindparam("uid"))
+    .values(last_login=bindparam("ts"))
+)
+
+# Batching limits: flush after this many logins or this many seconds, whichever comes first
+FLUSH_MAX_ROWS = 500
+FLUSH_INTERVAL_SECONDS = 0.1
+QUEUE_MAX_SIZE = 10000
+
+# Queue sentinel telling the flusher to write its current batch and exit
+_STOP = object()
+
+_login_queue: Optional[asyncio.Queue] = None
+_flusher_task: Optional[asyncio.Task] = None
+
+
+def record_login(user_id: int, login_time: Optional[datetime] = None) -> None:
+    """
+    Queue a user's last-login update without waiting on the database
+    
+    Args:
+        user_id: ID of the user who logged in
+        login_time: Login timestamp, captured now so batching does not skew it
+    """
+    login_time = login_time or datetime.now(timezone.utc)
+    if _login_queue is None:
+        # Flusher not running (e.g. scripts); write immediately
+        _write_last_logins({user_id: login_time})
+        return
+    
+    try:
+        _login_queue.put_nowait((user_id, login_time))
+    except asyncio.QueueFull:
+        logger.warning("Login activity queue full, dropping last-login update", user_id=user_id)
+
+
+def _write_last_logins(last_logins: Dict[int, datetime]) -> None:
+    """
+    Write a batch of last-login timestamps in a single executemany UPDATE
+    
+    Timestamps are stored in UTC to match the connection's '+00:00' time zone;
+    naive values are taken as local time and converted.
+    """
+    with get_db_session() as session:
+        session.execute(
+            _UPDATE_LAST_LOGIN,
+            [
+                {"uid": user_id, "ts": login_time.astimezone(timezone.utc)}
+                for user_id, login_time in last_logins.items()
+            ]
+        )
+
+
+async def _flush_login_activity(queue: asyncio.Queue) -> None:
+    """
+    Drain the queue in batches until the stop sentinel arrives
+    
+    The batch in progress when the sentinel is read is written before
+    returning, so no dequeued login is lost on shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    stopping = False
+    while not stopping:
+        item = await queue.get()
+        if item is _STOP:
+            return
+        user_id, login_time = item
+        batch = {user_id: login_time}
+        deadline = loop.time() + FLUSH_INTERVAL_SECONDS
+        
+        while len(batch) < FLUSH_MAX_ROWS:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            user_id, login_time = item
+            batch[user_id] = login_time
+        
+        try:
+            await asyncio.to_thread(_write_last_logins, batch)
+        except Exception as e:
+            logger.error("Failed to write login activity batch", error=str(e), batch_size=len(batch))
+
+
+def start_login_activity_flusher() -> None:
+    """Start the background task that batches last-login writes"""
+    global _login_queue, _flusher_task
+    
+    _login_queue = asyncio.Queue(maxsize=QUEUE_MAX_SIZE)
+    _flusher_task = asyncio.create_task(_flush_login_activity(_login_queue))
+    logger.info("Login activity flusher started")
+
+
+async def stop_login_activity_flusher() -> None:
+    """Stop the background task and write any logins still queued"""
+    global _login_queue, _flusher_task
+    
+    if _flusher_task is None or _login_queue is None:
+        return
+    
+    # Queued behind every pending login, so the flusher writes them all before exiting
+    await _login_queue.put(_STOP)
+    await _flusher_task
+    
+    # Logins recorded after the sentinel was queued
+    remaining: Dict[int, datetime] = {}
+    while not _login_queue.empty():
+        user_id, login_time = _login_queue.get_nowait()
+        remaining[user_id] = login_time
+    
+    _login_queue = None
+    _flusher_task = None
+    
+    if remaining:
+        try:
+            await asyncio.to_thread(_write_last_logins, remaining)
+        except Exception as e:
+            logger.error("Failed to write remaining login activity", error=str(e), batch_size=len(remaining))
+    
+    logger.info("Login activity flusher stopped")
@@ -3,12 +3,24 @@ Security utilities for the AuthService
 Includes JWT token handling, password hashing, and security functions
 """
 
+import asyncio
+import hashlib
+import os
+import re
 import secrets
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional, Union
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from jwt.exceptions import DecodeError, InvalidAlgorithmError
+from jwt.exceptions import PyJWTError as JWTError
 
 from app.core.config import get_settings
 from app.core.logging import get_logger, log_security_event
@@ -17,8 +29,49 @@ from app.core.logging import get_logger, log_security_event
 settings = get_settings()
 logger = get_logger(__name__)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Settings read on every token operation, resolved once; get_settings() is a
+# process-wide singleton, so they cannot change after import
+_SECRET_KEY = settings.secret_key
+_ALGORITHM = settings.algorithm
+_ALGORITHMS = [settings.algorithm]
+_ACCESS_TOKEN_TTL_SECONDS = settings.access_token_expire_minutes * 60
+_REFRESH_TOKEN_TTL_SECONDS = settings.refresh_token_expire_days * 86400
+_SUSPICIOUS_REQUEST_COUNT = settings.rate_limit_per_minute * 2
+# Encoded header segment shared by every token this service issues
+_TOKEN_HEADER_SEGMENT = jwt.encode({}, _SECRET_KEY, algorithm=_ALGORITHM).partition(".")[0]
+
+# argon2id for new hashes; bcrypt hashes from before the switch still verify
+# and are upgraded on the next successful login
+password_hasher = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost,
+    parallelism=settings.argon2_parallelism
+)
+
+# Dedicated threads for password hashing. argon2 and bcrypt both release the
+# GIL, so hashing runs in parallel without blocking the event loop or starving
+# the shared threadpool that serves sync endpoints.
+_password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers or os.cpu_count() or 1,
+    thread_name_prefix="password-hash"
+)
+
+# Recently verified tokens, keyed by a digest of the raw token so the tokens
+# themselves are not kept in memory. Entries hold (cache_expiry, payload) and
+# never outlive the token's own "exp".
+TOKEN_CACHE_MAXSIZE = 10000
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache: "OrderedDict[bytes, tuple[float, dict]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+# Characters accepted as "special" by validate_password_strength
+_PASSWORD_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+# User agent fragments flagged by is_suspicious_activity, matched in one pass
+_SUSPICIOUS_AGENT_RE = re.compile(r"bot|crawler|scraper|spider|curl|wget", re.IGNORECASE)
+
+# Characters stripped by sanitize_input, removed in a single translate() pass
+_SANITIZE_TABLE = str.maketrans("", "", "<>\"'&;|`$(){}")
 
 
 class SecurityError(Exception):
@@ -38,7 +91,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if password matches, False otherwise
     """
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        if hashed_password.startswith("$argon2"):
+            return password_hasher.verify(hashed_password, plain_password)
+        
+        # Legacy bcrypt hash
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8")
+        )
+    except VerifyMismatchError:
+        return False
     except Exception as e:
         logger.error("Password verification error", error=str(e))
         log_security_event(
@@ -51,7 +113,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt
+    Hash a password using argon2id
     
     Args:
         password: The plain text password to hash
@@ -63,7 +125,7 @@ def get_password_hash(password: str) -> str:
         SecurityError: If password hashing fails
     """
     try:
-        return pwd_context.hash(password)
+        return password_hasher.hash(password)
     except Exception as e:
         logger.error("Password hashing error", error=str(e))
         log_security_event(
@@ -74,6 +136,44 @@ def get_password_hash(password: str) -> str:
         raise SecurityError("Failed to hash password") from e
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced by a fresh argon2id hash
+    
+    Args:
+        hashed_password: The stored password hash
+        
+    Returns:
+        bool: True for legacy bcrypt hashes and argon2 hashes with outdated parameters
+    """
+    if not hashed_password.startswith("$argon2"):
+        return hashed_password.startswith("$2")
+    try:
+        return password_hasher.check_needs_rehash(hashed_password)
+    except Exception:
+        return False
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop
+    
+    Async endpoints should use this; verify_password remains for sync code and scripts.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_executor, verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Hash a password without blocking the event loop
+    
+    Async endpoints should use this; get_password_hash remains for sync code and scripts.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_executor, get_password_hash, password)
+
+
 def create_access_token(
     data: dict,
     expires_delta: Optional[timedelta] = None,
@@ -96,22 +196,21 @@ def create_access_token(
     try:
         to_encode = data.copy()
         
+        # "exp" is an integer epoch (RFC 7519 NumericDate); no datetime objects needed
         if expires_delta:
-            expire = datetime.now() + expires_delta
+            expire = int(time.time()) + int(expires_delta.total_seconds())
         else:
-            expire = datetime.now() + timedelta(
-                minutes=settings.access_token_expire_minutes
-            )
+            expire = int(time.time()) + _ACCESS_TOKEN_TTL_SECONDS
         
         to_encode.update({"exp": expire})
         
         encoded_jwt = jwt.encode(
             to_encode,
-            settings.secret_key,
-            algorithm=settings.algorithm
+            _SECRET_KEY,
+            algorithm=_ALGORITHM
         )
         
-        logger.info("Access token created", user_id=user_id, expires_at=expire.isoformat())
+        logger.debug("Access token created", user_id=user_id, expires_at=expire)
         return encoded_jwt
         
     except Exception as e:
@@ -147,21 +246,19 @@ def create_refresh_token(
         to_encode = data.copy()
         
         if expires_delta:
-            expire = datetime.now() + expires_delta
+            expire = int(time.time()) + int(expires_delta.total_seconds())
         else:
-            expire = datetime.now() + timedelta(
-                days=settings.refresh_token_expire_days
-            )
+            expire = int(time.time()) + _REFRESH_TOKEN_TTL_SECONDS
         
         to_encode.update({"exp": expire, "type": "refresh"})
         
         encoded_jwt = jwt.encode(
             to_encode,
-            settings.secret_key,
-            algorithm=settings.algorithm
+            _SECRET_KEY,
+            algorithm=_ALGORITHM
         )
         
-        logger.info("Refresh token created", user_id=user_id, expires_at=expire.isoformat())
+        logger.debug("Refresh token created", user_id=user_id, expires_at=expire)
         return encoded_jwt
         
     except Exception as e:
@@ -174,6 +271,71 @@ def create_refresh_token(
         raise SecurityError("Failed to create refresh token") from e
 
 
+def _token_cache_key(token: str) -> bytes:
+    """Digest used as the verified-token cache key"""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _get_cached_payload(token: str, now: float) -> Optional[dict]:
+    """Return the cached payload for a previously verified token, if still fresh"""
+    key = _token_cache_key(token)
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del _token_cache[key]
+            return None
+        _token_cache.move_to_end(key)
+        return dict(entry[1])
+
+
+def _cache_payload(token: str, payload: dict, now: float) -> None:
+    """Remember a verified payload until the cache TTL or the token's expiry"""
+    expiry = now + TOKEN_CACHE_TTL_SECONDS
+    if "exp" in payload:
+        expiry = min(expiry, payload["exp"])
+    key = _token_cache_key(token)
+    with _token_cache_lock:
+        _token_cache[key] = (expiry, dict(payload))
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+
+
+def hash_token_id(token_id: str) -> bytes:
+    """
+    Hash a JWT token ID for storage and lookup in revoked_tokens
+    
+    Args:
+        token_id: The JWT token ID (jti claim)
+        
+    Returns:
+        bytes: 16-byte blake2b digest of the token ID
+    """
+    return hashlib.blake2b(token_id.encode("utf-8"), digest_size=16).digest()
+
+
+def _check_token_header(token: str) -> None:
+    """
+    Reject malformed tokens or foreign algorithms before paying for signature verification
+    
+    Raises:
+        JWTError: If the token is not a three-part JWT signed with the configured algorithm
+    """
+    header_segment, separator, rest = token.partition(".")
+    if not separator or rest.count(".") != 1:
+        raise DecodeError("Not enough or too many segments")
+    
+    # Tokens issued by this service share one header, so the common case is a string compare
+    if header_segment == _TOKEN_HEADER_SEGMENT:
+        return
+    
+    header = jwt.get_unverified_header(token)
+    if header.get("alg") != _ALGORITHM:
+        raise InvalidAlgorithmError("The specified alg value is not allowed")
+
+
 def verify_token(token: str, user_id: Optional[str] = None) -> Optional[dict]:
     """
     Verify and decode a JWT token
@@ -189,16 +351,21 @@ def verify_token(token: str, user_id: Optional[str] = None) -> Optional[dict]:
         SecurityError: If token verification fails
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.algorithm]
-        )
+        now = time.time()
+        payload = _get_cached_payload(token, now)
+        if payload is None:
+            _check_token_header(token)
+            payload = jwt.decode(
+                token,
+                _SECRET_KEY,
+                algorithms=_ALGORITHMS
+            )
+            _cache_payload(token, payload, now)
         
         # Check if token is expired
         if "exp" in payload:
             exp_timestamp = payload["exp"]
-            if datetime.now().timestamp() > exp_timestamp:
+            if now > exp_timestamp:
                 logger.warning("Token expired", user_id=user_id, exp_timestamp=exp_timestamp)
                 log_security_event(
                     event_type="token_expired",
@@ -207,7 +374,7 @@ def verify_token(token: str, user_id: Optional[str] = None) -> Optional[dict]:
                 )
                 return None
         
-        logger.info("Token verified successfully", user_id=user_id)
+        logger.debug("Token verified successfully", user_id=user_id)
         return payload
         
     except JWTError as e:
@@ -256,16 +423,17 @@ def validate_password_strength(password: str) -> tuple[bool, list[str]]:
     if len(password) < 8:
         errors.append("Password must be at least 8 characters long")
     
-    if not any(c.isupper() for c in password):
+    # map() over the str methods keeps each scan in C instead of a Python generator
+    if not any(map(str.isupper, password)):
         errors.append("Password must contain at least one uppercase letter")
     
-    if not any(c.islower() for c in password):
+    if not any(map(str.islower, password)):
         errors.append("Password must contain at least one lowercase letter")
     
-    if not any(c.isdigit() for c in password):
+    if not any(map(str.isdigit, password)):
         errors.append("Password must contain at least one digit")
     
-    if not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+    if _PASSWORD_SPECIAL_CHARS.isdisjoint(password):
         errors.append("Password must contain at least one special character")
     
     return len(errors) == 0, errors
@@ -285,13 +453,7 @@ def sanitize_input(input_string: str) -> str:
         return ""
     
     # Remove potentially dangerous characters
-    dangerous_chars = ["<", ">", '"', "'", "&", ";", "|", "`", "$", "(", ")", "{", "}"]
-    sanitized = input_string
-    
-    for char in dangerous_chars:
-        sanitized = sanitized.replace(char, "")
-    
-    return sanitized.strip()
+    return input_string.translate(_SANITIZE_TABLE).strip()
 
 
 def rate_limit_key(client_ip: str, endpoint: str) -> str:
@@ -327,7 +489,7 @@ def is_suspicious_activity(
         bool: True if suspicious activity is detected
     """
     # Check for excessive requests
-    if request_count > settings.rate_limit_per_minute * 2:
+    if request_count > _SUSPICIOUS_REQUEST_COUNT:
         logger.warning("Excessive requests detected", 
                       client_ip=client_ip, 
                       endpoint=endpoint, 
@@ -335,8 +497,7 @@ def is_suspicious_activity(
         return True
     
     # Check for suspicious user agent
-    suspicious_agents = ["bot", "crawler", "scraper", "spider", "curl", "wget"]
-    if any(agent in user_agent.lower() for agent in suspicious_agents):
+    if _SUSPICIOUS_AGENT_RE.search(user_agent):
         logger.info("Suspicious user agent detected", 
                    client_ip=client_ip, 
                    user_agent=user_agent)
@@ -6,21 +6,26 @@ Includes comprehensive middleware, error handling, and startup/shutdown events
 import time
 from contextlib import asynccontextmanager
 from typing import Any
+from uuid import uuid4
 
+import structlog
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.v1.api import api_router
 from app.core.config import get_settings
 from app.core.database import init_database, close_database_connection, engine
-from app.core.logging import setup_logging, get_logger
+from app.core.email import warm_up_email_templates
+from app.core.login_activity import start_login_activity_flusher, stop_login_activity_flusher
+from app.core.logging import setup_logging, shutdown_logging, get_logger
 
-# Get settings
+# Get settings and logger
 settings = get_settings()
+logger = get_logger(__name__)
 
 
 @asynccontextmanager
@@ -30,7 +35,6 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events
     """
     # Startup
-    logger = get_logger(__name__)
     logger.info("Starting AuthGhost API", version="1.0.0")
     
     try:
@@ -49,6 +53,14 @@ async def lifespan(app: FastAPI):
         else:
             logger.error("Database connection test failed")
         
+        # Load email templates now so the first user-facing email is not slowed down
+        if settings.environment == "production":
+            warm_up_email_templates()
+            logger.info("Email templates preloaded")
+        
+        # Batch last-login writes in the background
+        start_login_activity_flusher()
+        
         logger.info("AuthGhost API started successfully")
         
     except Exception as e:
@@ -60,6 +72,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down AuthGhost API")
     try:
+        # Write any queued login activity before the pool goes away
+        await stop_login_activity_flusher()
+        
         # Close database connections
         close_database_connection(engine)
         logger.info("Database connections closed")
@@ -68,6 +83,9 @@ async def lifespan(app: FastAPI):
         
     except Exception as e:
         logger.error("Error during shutdown", error=str(e))
+    finally:
+        # Flush any queued log records before the process exits
+        shutdown_logging()
 
 
 # Create FastAPI application
@@ -92,6 +110,7 @@ app = FastAPI(
     docs_url="/docs",  # Always show Swagger docs
     redoc_url="/redoc",  # Always show ReDoc docs
     openapi_url="/openapi.json",  # Always show OpenAPI schema
+    default_response_class=ORJSONResponse,  # Encode responses with orjson (C) instead of json.dumps
     lifespan=lifespan
 )
 
@@ -115,22 +134,24 @@ app.add_middleware(
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """Add request processing time to response headers"""
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     
-    # Get request ID from headers or generate new one
-    request_id = request.headers.get("X-Request-ID", str(time.time()))
+    # Get request ID from headers or generate a unique one
+    request_id = request.headers.get("X-Request-ID") or uuid4().hex
     
-    # Add request ID to request state
+    # Add request ID to request state and to every log event of this request
     request.state.request_id = request_id
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(request_id=request_id)
     
     # Process request
     response = await call_next(request)
     
-    # Calculate processing time
-    process_time = time.time() - start_time
+    # Calculate processing time in milliseconds (monotonic, unaffected by clock changes)
+    process_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
     
     # Add timing headers
-    response.headers["X-Process-Time"] = str(process_time)
+    response.headers["X-Process-Time"] = f"{process_time_ms:.3f}"
     response.headers["X-Request-ID"] = request_id
     
     return response
@@ -140,8 +161,6 @@ async def add_process_time_header(request: Request, call_next):
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions"""
-    logger = get_logger(__name__)
-    
     # Log the error
     logger.error(
         "HTTP exception occurred",
@@ -152,7 +171,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         request_id=getattr(request.state, "request_id", "unknown")
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -166,8 +185,6 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors"""
-    logger = get_logger(__name__)
-    
     # Log the validation error
     logger.warning(
         "Request validation failed",
@@ -177,7 +194,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         request_id=getattr(request.state, "request_id", "unknown")
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Validation error",
@@ -192,8 +209,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
-    logger = get_logger(__name__)
-    
     # Log the error
     logger.error(
         "Unhandled exception occurred",
@@ -204,7 +219,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         request_id=getattr(request.state, "request_id", "unknown")
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal server error",
@@ -4,10 +4,12 @@ Represents organizations in the multi-tenant system
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, BigInteger
+from typing import List
+
+from sqlalchemy import String, DateTime, BigInteger
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
@@ -24,30 +26,22 @@ class Organization(Base):
     """
     
     __tablename__ = "organizations"
+    _DICT_FIELDS = ("id", "name", "created_at", "updated_at")
     
     # Primary key - using BIGINT for MySQL compatibility
-    id = Column(BIGINT, primary_key=True, autoincrement=True, index=True, comment="Organization ID")
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True, comment="Organization ID")
     
     # Organization information
-    name = Column(String(255), nullable=False, unique=True, index=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    users = relationship("User", back_populates="organization", cascade="all, delete-orphan")
-    subscriptions = relationship("OrganizationSubscription", back_populates="organization", cascade="all, delete-orphan")
+    users: Mapped[List["User"]] = relationship("User", back_populates="organization", cascade="all, delete-orphan")
+    subscriptions: Mapped[List["OrganizationSubscription"]] = relationship("OrganizationSubscription", back_populates="organization", cascade="all, delete-orphan")
     
     def __repr__(self) -> str:
         """String representation of the organization"""
-        return f"<Organization(id={self.id}, name='{self.name}')>"
-    
-    def to_dict(self) -> dict:
-        """Convert organization to dictionary"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
\ No newline at end of file
+        return f"<Organization(id={self.id}, name='{self.name}')>"
\ No newline at end of file
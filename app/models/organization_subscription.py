@@ -4,10 +4,10 @@ Represents organization subscriptions to services with specific tiers
 """
 
 from datetime import datetime, date
-from sqlalchemy import Column, BigInteger, ForeignKey, Date, Boolean, DateTime, UniqueConstraint
+from sqlalchemy import BigInteger, ForeignKey, Date, Boolean, DateTime, UniqueConstraint
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
@@ -28,27 +28,28 @@ class OrganizationSubscription(Base):
     """
     
     __tablename__ = "organization_subscriptions"
+    _DICT_FIELDS = ("id", "org_id", "service_id", "tier_id", "start_date", "end_date", "is_active", "created_at")
     
     # Primary key
-    id = Column(BIGINT, primary_key=True, autoincrement=True, index=True)
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True)
     
     # Foreign keys
-    org_id = Column(BIGINT, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
-    service_id = Column(BIGINT, ForeignKey("services.id", ondelete="CASCADE"), nullable=False, index=True)
-    tier_id = Column(BIGINT, ForeignKey("subscription_tiers.id", ondelete="CASCADE"), nullable=False, index=True)
+    org_id: Mapped[int] = mapped_column(BIGINT, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
+    service_id: Mapped[int] = mapped_column(BIGINT, ForeignKey("services.id", ondelete="CASCADE"), nullable=False, index=True)
+    tier_id: Mapped[int] = mapped_column(BIGINT, ForeignKey("subscription_tiers.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Subscription information
-    start_date = Column(Date, nullable=False)
-    end_date = Column(Date, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    end_date: Mapped[date] = mapped_column(Date, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    organization = relationship("Organization", back_populates="subscriptions")
-    service = relationship("Service", back_populates="subscriptions")
-    tier = relationship("SubscriptionTier", back_populates="subscriptions")
+    organization: Mapped["Organization"] = relationship("Organization", back_populates="subscriptions")
+    service: Mapped["Service"] = relationship("Service", back_populates="subscriptions")
+    tier: Mapped["SubscriptionTier"] = relationship("SubscriptionTier", back_populates="subscriptions")
     
     # Unique constraint
     __table_args__ = (
@@ -57,17 +58,4 @@ class OrganizationSubscription(Base):
     
     def __repr__(self) -> str:
         """String representation of the organization subscription"""
-        return f"<OrganizationSubscription(id={self.id}, org_id={self.org_id}, service_id={self.service_id})>"
-    
-    def to_dict(self) -> dict:
-        """Convert organization subscription to dictionary"""
-        return {
-            "id": self.id,
-            "org_id": self.org_id,
-            "service_id": self.service_id,
-            "tier_id": self.tier_id,
-            "start_date": self.start_date.isoformat() if self.start_date else None,
-            "end_date": self.end_date.isoformat() if self.end_date else None,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None
-        }
\ No newline at end of file
+        return f"<OrganizationSubscription(id={self.id}, org_id={self.org_id}, service_id={self.service_id})>"
\ No newline at end of file
@@ -4,10 +4,10 @@ Represents revoked JWT tokens for security purposes
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, BigInteger, ForeignKey, DateTime
+from sqlalchemy import BINARY, String, BigInteger, ForeignKey, DateTime, Index, bindparam, select
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
@@ -19,34 +19,39 @@ class RevokedToken(Base):
     Fields:
         id: Unique identifier for the revoked token record
         token_id: JWT token ID (jti claim)
+        token_hash: 16-byte blake2b digest of token_id, used for lookups
         user_id: Reference to the user who owned the token
         revoked_at: When the token was revoked
     """
     
     __tablename__ = "revoked_tokens"
+    _DICT_FIELDS = ("id", "token_id", "user_id", "revoked_at")
+    __table_args__ = (
+        Index("ix_revoked_tokens_user_id_revoked_at", "user_id", "revoked_at"),
+    )
     
     # Primary key
-    id = Column(BIGINT, primary_key=True, autoincrement=True, index=True)
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True)
     
     # Token information
-    token_id = Column(String(255), nullable=False, index=True)
-    user_id = Column(BIGINT, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    token_hash: Mapped[bytes] = mapped_column(BINARY(16), nullable=False, unique=True, index=True)
+    user_id: Mapped[int] = mapped_column(BIGINT, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Timestamps
-    revoked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="revoked_tokens")
+    user: Mapped["User"] = relationship("User", back_populates="revoked_tokens")
     
     def __repr__(self) -> str:
         """String representation of the revoked token"""
         return f"<RevokedToken(id={self.id}, token_id='{self.token_id}', user_id={self.user_id})>"
-    
-    def to_dict(self) -> dict:
-        """Convert revoked token to dictionary"""
-        return {
-            "id": self.id,
-            "token_id": self.token_id,
-            "user_id": self.user_id,
-            "revoked_at": self.revoked_at.isoformat() if self.revoked_at else None
-        }
\ No newline at end of file
+
+
+# Prebuilt statement for the revocation check by token hash
+REVOKED_TOKEN_ID_BY_HASH = (
+    select(RevokedToken.id)
+    .where(RevokedToken.token_hash == bindparam("token_hash"))
+    .limit(1)
+)
@@ -4,10 +4,12 @@ Represents service-specific roles with JSON permissions
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, BigInteger, ForeignKey, JSON, DateTime
+from typing import List
+
+from sqlalchemy import String, BigInteger, ForeignKey, JSON, DateTime, select
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
@@ -25,32 +27,28 @@ class Role(Base):
     """
     
     __tablename__ = "roles"
+    _DICT_FIELDS = ("id", "name", "service_id", "permissions", "created_at")
     
     # Primary key
-    id = Column(BIGINT, primary_key=True, autoincrement=True, index=True)
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True)
     
     # Role information
-    name = Column(String(50), nullable=False)
-    service_id = Column(BIGINT, ForeignKey("services.id", ondelete="CASCADE"), nullable=False, index=True)
-    permissions = Column(JSON, nullable=False)
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+    service_id: Mapped[int] = mapped_column(BIGINT, ForeignKey("services.id", ondelete="CASCADE"), nullable=False, index=True)
+    permissions: Mapped[dict] = mapped_column(JSON, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    service = relationship("Service", back_populates="roles")
-    user_roles = relationship("UserRole", back_populates="role", cascade="all, delete-orphan")
+    service: Mapped["Service"] = relationship("Service", back_populates="roles")
+    user_roles: Mapped[List["UserRole"]] = relationship("UserRole", back_populates="role", cascade="all, delete-orphan")
     
     def __repr__(self) -> str:
         """String representation of the role"""
         return f"<Role(id={self.id}, name='{self.name}', service_id={self.service_id})>"
-    
-    def to_dict(self) -> dict:
-        """Convert role to dictionary"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "service_id": self.service_id,
-            "permissions": self.permissions,
-            "created_at": self.created_at.isoformat() if self.created_at else None
-        }
\ No newline at end of file
+
+
+# Column-only listing for read endpoints; returns plain rows, skipping ORM
+# entity construction and identity-map bookkeeping
+ROLE_LIST = select(*(getattr(Role, field) for field in Role._DICT_FIELDS))
@@ -4,10 +4,12 @@ Represents services in the microservices architecture
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, Text, Enum, DateTime, BigInteger
+from typing import List, Optional
+
+from sqlalchemy import String, Text, Enum, DateTime, BigInteger
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
@@ -25,33 +27,24 @@ class Service(Base):
     """
     
     __tablename__ = "services"
+    _DICT_FIELDS = ("id", "name", "description", "status", "created_at")
     
     # Primary key - using BIGINT for MySQL compatibility
-    id = Column(BIGINT, primary_key=True, autoincrement=True, index=True, comment="Service ID")
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True, comment="Service ID")
     
     # Service information
-    name = Column(String(100), nullable=False, unique=True, index=True)
-    description = Column(String(255), nullable=True)
-    status = Column(Enum('active', 'inactive', name='service_status'), default='active', nullable=False)
+    name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    status: Mapped[str] = mapped_column(Enum('active', 'inactive', name='service_status'), default='active', nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    roles = relationship("Role", back_populates="service", cascade="all, delete-orphan")
-    subscription_tiers = relationship("SubscriptionTier", back_populates="service", cascade="all, delete-orphan")
-    subscriptions = relationship("OrganizationSubscription", back_populates="service", cascade="all, delete-orphan")
+    roles: Mapped[List["Role"]] = relationship("Role", back_populates="service", cascade="all, delete-orphan")
+    subscription_tiers: Mapped[List["SubscriptionTier"]] = relationship("SubscriptionTier", back_populates="service", cascade="all, delete-orphan")
+    subscriptions: Mapped[List["OrganizationSubscription"]] = relationship("OrganizationSubscription", back_populates="service", cascade="all, delete-orphan")
     
     def __repr__(self) -> str:
         """String representation of the service"""
-        return f"<Service(id={self.id}, name='{self.name}', status='{self.status}')>"
-    
-    def to_dict(self) -> dict:
-        """Convert service to dictionary"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None
-        }
\ No newline at end of file
+        return f"<Service(id={self.id}, name='{self.name}', status='{self.status}')>"
\ No newline at end of file
@@ -4,10 +4,12 @@ Represents service-specific subscription tiers
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, BigInteger, ForeignKey, JSON, DateTime, UniqueConstraint
+from typing import List
+
+from sqlalchemy import String, BigInteger, ForeignKey, JSON, DateTime, UniqueConstraint
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
@@ -25,23 +27,24 @@ class SubscriptionTier(Base):
     """
     
     __tablename__ = "subscription_tiers"
+    _DICT_FIELDS = ("id", "service_id", "tier_name", "features", "created_at")
     
     # Primary key
-    id = Column(BIGINT, primary_key=True, autoincrement=True, index=True)
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True)
     
     # Foreign keys
-    service_id = Column(BIGINT, ForeignKey("services.id", ondelete="CASCADE"), nullable=False, index=True)
+    service_id: Mapped[int] = mapped_column(BIGINT, ForeignKey("services.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Tier information
-    tier_name = Column(String(50), nullable=False)
-    features = Column(JSON, nullable=False)
+    tier_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    features: Mapped[dict] = mapped_column(JSON, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    service = relationship("Service", back_populates="subscription_tiers")
-    subscriptions = relationship("OrganizationSubscription", back_populates="tier")
+    service: Mapped["Service"] = relationship("Service", back_populates="subscription_tiers")
+    subscriptions: Mapped[List["OrganizationSubscription"]] = relationship("OrganizationSubscription", back_populates="tier")
     
     # Unique constraint
     __table_args__ = (
@@ -50,14 +53,4 @@ class SubscriptionTier(Base):
     
     def __repr__(self) -> str:
         """String representation of the subscription tier"""
-        return f"<SubscriptionTier(id={self.id}, tier_name='{self.tier_name}', service_id={self.service_id})>"
-    
-    def to_dict(self) -> dict:
-        """Convert subscription tier to dictionary"""
-        return {
-            "id": self.id,
-            "service_id": self.service_id,
-            "tier_name": self.tier_name,
-            "features": self.features,
-            "created_at": self.created_at.isoformat() if self.created_at else None
-        }
\ No newline at end of file
+        return f"<SubscriptionTier(id={self.id}, tier_name='{self.tier_name}', service_id={self.service_id})>"
\ No newline at end of file
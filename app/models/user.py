@@ -4,12 +4,17 @@ Includes user information and authentication fields for multi-tenant system
 """
 
 from datetime import datetime
-from sqlalchemy import Boolean, Column, DateTime, String, BigInteger, ForeignKey
-from sqlalchemy.dialects.mysql import BIGINT
+from functools import lru_cache
+from typing import List, Optional
+
+from sqlalchemy import Boolean, DateTime, String, BigInteger, ForeignKey, bindparam, select
+from sqlalchemy.dialects.mysql import BIGINT, VARCHAR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, raiseload, relationship, selectinload
 
 from app.core.database import Base
+from app.models.role import Role
+from app.models.user_role import UserRole
 
 
 class User(Base):
@@ -30,52 +35,77 @@ class User(Base):
     """
     
     __tablename__ = "users"
+    # Fields exposed by to_dict() (sensitive fields such as the password hash are excluded)
+    _DICT_FIELDS = (
+        "id", "org_id", "email", "first_name", "last_name", "is_active",
+        "created_at", "updated_at", "last_login",
+    )
+    # Load server-generated timestamps during the INSERT flush instead of on first access
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key - using BIGINT for MySQL compatibility
-    id = Column(BIGINT, primary_key=True, autoincrement=True, index=True, comment="User ID")
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True, comment="User ID")
     
     # Multi-tenant fields
-    org_id = Column(BIGINT, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
+    org_id: Mapped[int] = mapped_column(BIGINT, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Authentication fields
-    email = Column(String(255), nullable=False, unique=True, index=True)
-    password_hash = Column(String(255), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    # bcrypt (60) and argon2id (~97) hashes are pure ASCII; 1 byte per char instead of utf8mb4's 4
+    password_hash: Mapped[str] = mapped_column(
+        String(128).with_variant(VARCHAR(128, charset="ascii", collation="ascii_bin"), "mysql"),
+        nullable=False
+    )
     
     # Personal information
-    first_name = Column(String(100), nullable=True)
-    last_name = Column(String(100), nullable=True)
+    first_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    last_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     
     # Status fields
-    is_active = Column(Boolean, default=True, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    last_login = Column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    last_login: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    organization = relationship("Organization", back_populates="users")
-    user_roles = relationship("UserRole", back_populates="user", cascade="all, delete-orphan")
-    revoked_tokens = relationship("RevokedToken", back_populates="user", cascade="all, delete-orphan")
+    organization: Mapped["Organization"] = relationship("Organization", back_populates="users")
+    user_roles: Mapped[List["UserRole"]] = relationship("UserRole", back_populates="user", cascade="all, delete-orphan")
+    revoked_tokens: Mapped[List["RevokedToken"]] = relationship("RevokedToken", back_populates="user", cascade="all, delete-orphan")
     
     def __repr__(self) -> str:
         """String representation of the user"""
         return f"<User(id={self.id}, email='{self.email}')>"
+
+
+# Prebuilt statements for per-request lookups; SQLAlchemy caches their compiled
+# SQL, and building them once skips the query construction on every call
+USER_BY_ID = select(User).where(User.id == bindparam("user_id")).limit(1)
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
+
+# Column-only listing for read endpoints; returns plain rows, skipping ORM
+# entity construction and identity-map bookkeeping
+USER_LIST = select(*(getattr(User, field) for field in User._DICT_FIELDS))
+
+
+@lru_cache(maxsize=None)
+def _user_context_options() -> tuple:
+    """
+    Eager-loading options for the organization and role/service graph
     
-    def to_dict(self) -> dict:
-        """Convert user to dictionary (excluding sensitive fields)"""
-        return {
-            "id": self.id,
-            "org_id": self.org_id,
-            "email": self.email,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "last_login": self.last_login.isoformat() if self.last_login else None
-        }
-    
-    def update_last_login(self) -> None:
-        """Update the last login timestamp"""
-        self.last_login = datetime.now() 
\ No newline at end of file
+    Loads each level with one query instead of one lazy load per role; any other
+    User relationship raises instead of lazy loading, so new N+1 accesses fail
+    fast. Built on first use because the related mappers are only complete once
+    every model module has been imported.
+    """
+    return (
+        selectinload(User.organization),
+        selectinload(User.user_roles).selectinload(UserRole.role).selectinload(Role.service),
+        raiseload("*"),
+    )
+
+
+def with_context(stmt):
+    """Apply the organization and role eager-loading options to a User select"""
+    return stmt.options(*_user_context_options())
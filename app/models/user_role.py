@@ -4,10 +4,12 @@ Represents the many-to-many relationship between users and roles
 """
 
 from datetime import datetime
-from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, UniqueConstraint
+from typing import Iterable
+
+from sqlalchemy import BigInteger, ForeignKey, DateTime, insert
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from app.core.database import Base
 
@@ -17,42 +19,42 @@ class UserRole(Base):
     UserRole model representing the many-to-many relationship between users and roles
     
     Fields:
-        id: Unique identifier for the user role
-        user_id: Reference to the user
-        role_id: Reference to the role
+        user_id: Reference to the user (primary key part)
+        role_id: Reference to the role (primary key part)
         created_at: When the user role was created
     """
     
     __tablename__ = "user_roles"
+    _DICT_FIELDS = ("user_id", "role_id", "created_at")
     
-    # Primary key
-    id = Column(BIGINT, primary_key=True, autoincrement=True, index=True)
-    
-    # Foreign keys
-    user_id = Column(BIGINT, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    role_id = Column(BIGINT, ForeignKey("roles.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Composite primary key: clusters a user's roles together and serves user_id lookups
+    user_id: Mapped[int] = mapped_column(BIGINT, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    role_id: Mapped[int] = mapped_column(BIGINT, ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True, index=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="user_roles")
-    role = relationship("Role", back_populates="user_roles")
-    
-    # Unique constraint
-    __table_args__ = (
-        UniqueConstraint('user_id', 'role_id', name='unique_user_role'),
-    )
+    user: Mapped["User"] = relationship("User", back_populates="user_roles")
+    role: Mapped["Role"] = relationship("Role", back_populates="user_roles")
     
     def __repr__(self) -> str:
         """String representation of the user role"""
-        return f"<UserRole(id={self.id}, user_id={self.user_id}, role_id={self.role_id})>"
-    
-    def to_dict(self) -> dict:
-        """Convert user role to dictionary"""
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "role_id": self.role_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None
-        }
\ No newline at end of file
+        return f"<UserRole(user_id={self.user_id}, role_id={self.role_id})>"
+
+
+def bulk_insert_user_roles(session: Session, user_id: int, role_ids: Iterable[int]) -> None:
+    """
+    Insert user role assignments in a single statement
+    
+    Core insert() with a list of parameter sets is sent as one multi-row
+    INSERT (insertmanyvalues) instead of one INSERT per ORM object.
+    
+    Args:
+        session: Database session
+        user_id: User receiving the roles
+        role_ids: Roles to assign
+    """
+    rows = [{"user_id": user_id, "role_id": role_id} for role_id in role_ids]
+    if rows:
+        session.execute(insert(UserRole), rows)
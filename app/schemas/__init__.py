@@ -2,24 +2,72 @@
 Schemas package for AuthGhost API
 """
 
-from .auth import (
-    UserCreate, UserLogin, UserResponse, TokenResponse, 
-    RefreshTokenRequest, UserProfileResponse, HealthCheck
-)
-from .user import UserUpdate, UserResponse as UserResponseSchema
-from .organization import OrganizationCreate, OrganizationUpdate, OrganizationResponse
-from .role import RoleCreate, RoleUpdate, RoleResponse
-from .service import ServiceCreate, ServiceUpdate, ServiceResponse
-from .subscription_tier import SubscriptionTierCreate, SubscriptionTierUpdate, SubscriptionTierResponse
-from .organization_subscription import (
-    OrganizationSubscriptionCreate, OrganizationSubscriptionUpdate, OrganizationSubscriptionResponse
-)
-from .token import TokenRevokeRequest, RevokedTokenResponse
+import importlib
+
+# Exported name -> (submodule, attribute). Submodules are imported on first
+# access (PEP 562) so importing one schema family does not build every
+# pydantic model in the package.
+_LAZY_EXPORTS = {
+    # Auth schemas
+    "UserCreate": ("auth", "UserCreate"),
+    "UserLogin": ("auth", "UserLogin"),
+    "UserResponse": ("auth", "UserResponse"),
+    "TokenResponse": ("auth", "TokenResponse"),
+    "RefreshTokenRequest": ("auth", "RefreshTokenRequest"),
+    "UserProfilePayload": ("auth", "UserProfilePayload"),
+    "UserProfileResponse": ("auth", "UserProfileResponse"),
+    "HealthCheck": ("auth", "HealthCheck"),
+    
+    # User schemas
+    "UserUpdate": ("user", "UserUpdate"),
+    "UserResponseSchema": ("user", "UserResponse"),
+    
+    # Organization schemas
+    "OrganizationCreate": ("organization", "OrganizationCreate"),
+    "OrganizationUpdate": ("organization", "OrganizationUpdate"),
+    "OrganizationResponse": ("organization", "OrganizationResponse"),
+    
+    # Role schemas
+    "RoleCreate": ("role", "RoleCreate"),
+    "RoleUpdate": ("role", "RoleUpdate"),
+    "RoleResponse": ("role", "RoleResponse"),
+    
+    # Service schemas
+    "ServiceCreate": ("service", "ServiceCreate"),
+    "ServiceUpdate": ("service", "ServiceUpdate"),
+    "ServiceResponse": ("service", "ServiceResponse"),
+    
+    # Subscription tier schemas
+    "SubscriptionTierCreate": ("subscription_tier", "SubscriptionTierCreate"),
+    "SubscriptionTierUpdate": ("subscription_tier", "SubscriptionTierUpdate"),
+    "SubscriptionTierResponse": ("subscription_tier", "SubscriptionTierResponse"),
+    
+    # Organization subscription schemas
+    "OrganizationSubscriptionCreate": ("organization_subscription", "OrganizationSubscriptionCreate"),
+    "OrganizationSubscriptionUpdate": ("organization_subscription", "OrganizationSubscriptionUpdate"),
+    "OrganizationSubscriptionResponse": ("organization_subscription", "OrganizationSubscriptionResponse"),
+    
+    # Token schemas
+    "TokenRevokeRequest": ("token", "TokenRevokeRequest"),
+    "RevokedTokenResponse": ("token", "RevokedTokenResponse"),
+}
+
+
+def __getattr__(name: str):
+    """Import the schema's submodule on first access and cache the attribute"""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Auth schemas
     "UserCreate", "UserLogin", "UserResponse", "TokenResponse", 
-    "RefreshTokenRequest", "UserProfileResponse", "HealthCheck",
+    "RefreshTokenRequest", "UserProfilePayload", "UserProfileResponse", "HealthCheck",
     
     # User schemas
     "UserUpdate", "UserResponseSchema",
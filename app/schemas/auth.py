@@ -3,17 +3,20 @@ Authentication schemas for the AuthService
 Includes request/response models for all authentication operations
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.common import ServiceDetails, SubscriptionTierDetails
+from app.schemas.types import EmailStr, JsonObject, PersonName
 
 
 class UserCreate(BaseModel):
     """Schema for user registration"""
     email: EmailStr = Field(..., description="User's email address")
     password: str = Field(..., min_length=8, description="User's password")
-    first_name: Optional[str] = Field(None, max_length=100, description="User's first name")
-    last_name: Optional[str] = Field(None, max_length=100, description="User's last name")
+    first_name: Optional[PersonName] = Field(None, description="User's first name")
+    last_name: Optional[PersonName] = Field(None, description="User's last name")
     org_id: int = Field(..., description="Organization ID for the user")
     service_id: int = Field(..., description="Service ID for the user")
 
@@ -42,49 +45,25 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str = Field(..., description="Refresh token")
 
 
-class ServiceDetails(BaseModel):
-    """Service details for user profile response"""
-    id: int = Field(..., description="Service ID")
-    name: str = Field(..., description="Service name")
-    description: Optional[str] = Field(None, description="Service description")
-    status: str = Field(..., description="Service status")
-    
-    class Config:
-        from_attributes = True
-
-
-class SubscriptionTierDetails(BaseModel):
-    """Subscription tier details for user profile response"""
-    id: int = Field(..., description="Subscription tier ID")
-    service_id: int = Field(..., description="Service ID")
-    tier_name: str = Field(..., description="Tier name")
-    features: dict = Field(..., description="Tier features")
-    
-    class Config:
-        from_attributes = True
-
-
 class RoleDetails(BaseModel):
     """Role details for user profile response"""
     id: int = Field(..., description="Role ID")
     name: str = Field(..., description="Role name")
     service_id: int = Field(..., description="Service ID")
-    permissions: dict = Field(..., description="Role permissions")
+    permissions: JsonObject = Field(..., description="Role permissions")
     service: ServiceDetails = Field(..., description="Service details")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class OrganizationDetails(BaseModel):
     """Organization details for user profile response"""
     id: int = Field(..., description="Organization ID")
     name: str = Field(..., description="Organization name")
-    created_at: Optional[str] = Field(None, description="Organization creation date")
-    updated_at: Optional[str] = Field(None, description="Organization last update date")
+    created_at: Optional[datetime] = Field(None, description="Organization creation date")
+    updated_at: Optional[datetime] = Field(None, description="Organization last update date")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class SubscriptionDetails(BaseModel):
@@ -92,19 +71,36 @@ class SubscriptionDetails(BaseModel):
     id: int = Field(..., description="Subscription ID")
     service_id: int = Field(..., description="Service ID")
     tier_id: int = Field(..., description="Tier ID")
-    start_date: str = Field(..., description="Subscription start date")
-    end_date: str = Field(..., description="Subscription end date")
+    start_date: date = Field(..., description="Subscription start date")
+    end_date: date = Field(..., description="Subscription end date")
     is_active: bool = Field(..., description="Whether subscription is active")
     service: ServiceDetails = Field(..., description="Service details")
     tier: SubscriptionTierDetails = Field(..., description="Tier details")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+class UserProfilePayload(BaseModel):
+    """User information with roles, organization, and subscriptions"""
+    id: int = Field(..., description="User ID")
+    org_id: int = Field(..., description="Organization ID")
+    email: str = Field(..., description="User's email address")
+    first_name: Optional[str] = Field(None, description="User's first name")
+    last_name: Optional[str] = Field(None, description="User's last name")
+    is_active: bool = Field(..., description="Whether user is active")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+    last_login: Optional[datetime] = Field(None, description="Last login timestamp")
+    roles: List[RoleDetails] = Field(..., description="User's roles with service details")
+    organization: Optional[OrganizationDetails] = Field(None, description="User's organization")
+    subscriptions: List[SubscriptionDetails] = Field(..., description="Organization's active subscriptions")
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class UserProfileResponse(BaseModel):
     """Schema for user profile response with full details"""
-    user: Dict[str, Any] = Field(..., description="User information including roles, organization, and subscriptions")
+    user: UserProfilePayload = Field(..., description="User information including roles, organization, and subscriptions")
 
 
 class HealthCheck(BaseModel):
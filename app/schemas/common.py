@@ -0,0 +1,69 @@
+"""
+Nested detail schemas shared by AuthGhost API responses
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.types import JsonObject
+
+
+class TrustedResponse(BaseModel):
+    """
+    Base for flat response schemas built from database rows
+    
+    from_orm_trusted() output is constructed, not validated: only use it for
+    trusted rows whose column types already match the declared fields.
+    """
+    
+    # Field names and a C-level getter reading them all from a row, set per subclass
+    _trusted_fields: ClassVar[Tuple[str, ...]] = ()
+    _read_trusted_fields: ClassVar[Callable[[Any], Tuple[Any, ...]]] = staticmethod(lambda obj: ())
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Bind the field getter once when the response class is created"""
+        super().__pydantic_init_subclass__(**kwargs)
+        names = tuple(cls.model_fields)
+        cls._trusted_fields = names
+        if names:
+            # attrgetter returns a bare value, not a tuple, for a single name
+            getter = attrgetter(*names)
+            cls._read_trusted_fields = staticmethod(getter if len(names) > 1 else lambda obj: (getter(obj),))
+    
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """
+        Build a response from a database row without re-validating it
+        
+        model_construct skips the per-field validation that model_validate would run;
+        the attributes are read by the getter bound when the class was created.
+        
+        Args:
+            obj: Entity or row exposing the response fields as attributes
+            
+        Returns:
+            Response populated from obj
+        """
+        return cls.model_construct(**dict(zip(cls._trusted_fields, cls._read_trusted_fields(obj))))
+
+
+class ServiceDetails(BaseModel):
+    """Service details embedded in profile and subscription responses"""
+    id: int = Field(..., description="Service ID")
+    name: str = Field(..., description="Service name")
+    description: Optional[str] = Field(None, description="Service description")
+    status: str = Field(..., description="Service status")
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+class SubscriptionTierDetails(BaseModel):
+    """Subscription tier details embedded in profile and subscription responses"""
+    id: int = Field(..., description="Subscription tier ID")
+    service_id: int = Field(..., description="Service ID")
+    tier_name: str = Field(..., description="Tier name")
+    features: JsonObject = Field(..., description="Tier features")
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
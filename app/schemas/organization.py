@@ -4,12 +4,14 @@ Organization schemas for AuthGhost API
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.types import OrganizationName
 
 
 class OrganizationBase(BaseModel):
     """Base organization schema"""
-    name: str = Field(..., min_length=1, max_length=255, description="Organization name")
+    name: OrganizationName = Field(..., description="Organization name")
 
 
 class OrganizationCreate(OrganizationBase):
@@ -19,7 +21,7 @@ class OrganizationCreate(OrganizationBase):
 
 class OrganizationUpdate(BaseModel):
     """Schema for updating an organization"""
-    name: Optional[str] = Field(None, min_length=1, max_length=255, description="Organization name")
+    name: Optional[OrganizationName] = Field(None, description="Organization name")
 
 
 class OrganizationResponse(OrganizationBase):
@@ -28,5 +30,4 @@ class OrganizationResponse(OrganizationBase):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
\ No newline at end of file
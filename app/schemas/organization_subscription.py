@@ -4,29 +4,9 @@ Organization subscription schemas for AuthGhost API
 
 from datetime import date, datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-
-class ServiceDetails(BaseModel):
-    """Service details for organization subscription response"""
-    id: int = Field(..., description="Service ID")
-    name: str = Field(..., description="Service name")
-    description: Optional[str] = Field(None, description="Service description")
-    status: str = Field(..., description="Service status")
-    
-    class Config:
-        from_attributes = True
-
-
-class SubscriptionTierDetails(BaseModel):
-    """Subscription tier details for organization subscription response"""
-    id: int = Field(..., description="Subscription tier ID")
-    service_id: int = Field(..., description="Service ID")
-    tier_name: str = Field(..., description="Tier name")
-    features: dict = Field(..., description="Tier features")
-    
-    class Config:
-        from_attributes = True
+from app.schemas.common import ServiceDetails, SubscriptionTierDetails
 
 
 class OrganizationSubscriptionBase(BaseModel):
@@ -59,5 +39,4 @@ class OrganizationSubscriptionResponse(OrganizationSubscriptionBase):
     service: ServiceDetails = Field(..., description="Service details")
     tier: SubscriptionTierDetails = Field(..., description="Subscription tier details")
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
\ No newline at end of file
@@ -3,22 +3,21 @@ Service schemas for AuthGhost API
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
-from enum import Enum
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.types import ServiceDescription, ServiceName
 
-class ServiceStatus(str, Enum):
-    """Service status enumeration"""
-    ACTIVE = "active"
-    INACTIVE = "inactive"
+
+# Service status values, matching the service_status column enum
+ServiceStatus = Literal["active", "inactive"]
 
 
 class ServiceBase(BaseModel):
     """Base service schema"""
-    name: str = Field(..., min_length=1, max_length=100, description="Service name")
-    description: Optional[str] = Field(None, max_length=255, description="Service description")
-    status: ServiceStatus = Field(ServiceStatus.ACTIVE, description="Service status")
+    name: ServiceName = Field(..., description="Service name")
+    description: Optional[ServiceDescription] = Field(None, description="Service description")
+    status: ServiceStatus = Field("active", description="Service status")
 
 
 class ServiceCreate(ServiceBase):
@@ -28,8 +27,8 @@ class ServiceCreate(ServiceBase):
 
 class ServiceUpdate(BaseModel):
     """Schema for updating a service"""
-    name: Optional[str] = Field(None, min_length=1, max_length=100, description="Service name")
-    description: Optional[str] = Field(None, max_length=255, description="Service description")
+    name: Optional[ServiceName] = Field(None, description="Service name")
+    description: Optional[ServiceDescription] = Field(None, description="Service description")
     status: Optional[ServiceStatus] = Field(None, description="Service status")
 
 
@@ -38,5 +37,4 @@ class ServiceResponse(ServiceBase):
     id: int = Field(..., description="Service ID")
     created_at: datetime = Field(..., description="Creation timestamp")
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
\ No newline at end of file
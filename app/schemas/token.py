@@ -3,7 +3,9 @@ Token schemas for AuthGhost API
 """
 
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.common import TrustedResponse
 
 
 class TokenRevokeRequest(BaseModel):
@@ -11,12 +13,11 @@ class TokenRevokeRequest(BaseModel):
     token_id: str = Field(..., description="JWT token ID to revoke")
 
 
-class RevokedTokenResponse(BaseModel):
+class RevokedTokenResponse(TrustedResponse):
     """Schema for revoked token response"""
     id: int = Field(..., description="Revoked token record ID")
     token_id: str = Field(..., description="JWT token ID")
     user_id: int = Field(..., description="User ID who owned the token")
     revoked_at: datetime = Field(..., description="Revocation timestamp")
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Shared field types for AuthGhost API schemas
+"""
+
+from functools import lru_cache
+from typing import Annotated, Any, Dict
+
+from pydantic import AfterValidator, BeforeValidator, Field, WithJsonSchema
+from pydantic.networks import validate_email
+from pydantic_core import from_json
+
+
+@lru_cache(maxsize=8192)
+def _normalize_email(value: str) -> str:
+    """
+    Validate and normalize an email address, memoized per input string
+    
+    Uses the same email-validator based check as pydantic's EmailStr; repeated
+    addresses (login retries, bulk imports) skip the parse. Invalid addresses
+    raise and are not cached.
+    
+    Args:
+        value: Raw email address
+        
+    Returns:
+        str: Normalized email address
+    """
+    return validate_email(value)[1]
+
+
+# Drop-in replacement for EmailStr with cached validation
+EmailStr = Annotated[
+    str,
+    AfterValidator(_normalize_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
+def _parse_json_object(value: Any) -> Any:
+    """
+    Decode JSON columns that arrive as text or bytes, leaving other values untouched
+    
+    Parsing uses pydantic-core's Rust JSON parser, which takes bytes without a
+    UTF-8 decode step; invalid JSON is passed through so the dict validation
+    reports the error.
+    
+    Args:
+        value: Raw column value
+        
+    Returns:
+        Any: Decoded value, or the input if it is not a valid JSON string
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        try:
+            return from_json(value)
+        except ValueError:
+            return value
+    return value
+
+
+# JSON object column that may be stored or returned as a JSON string
+JsonObject = Annotated[Dict[str, Any], BeforeValidator(_parse_json_object)]
+
+# Column-length constraints shared by the create and update schemas
+OrganizationName = Annotated[str, Field(min_length=1, max_length=255)]
+ServiceName = Annotated[str, Field(min_length=1, max_length=100)]
+ServiceDescription = Annotated[str, Field(max_length=255)]
+RoleName = Annotated[str, Field(min_length=1, max_length=50)]
+TierName = Annotated[str, Field(min_length=1, max_length=50)]
+PersonName = Annotated[str, Field(max_length=100)]
@@ -4,19 +4,22 @@ User schemas for AuthGhost API
 
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.common import TrustedResponse
+from app.schemas.types import EmailStr, PersonName
 
 
 class UserUpdate(BaseModel):
     """Schema for updating a user"""
     email: Optional[EmailStr] = Field(None, description="User's email address")
-    first_name: Optional[str] = Field(None, max_length=100, description="User's first name")
-    last_name: Optional[str] = Field(None, max_length=100, description="User's last name")
+    first_name: Optional[PersonName] = Field(None, description="User's first name")
+    last_name: Optional[PersonName] = Field(None, description="User's last name")
     is_active: Optional[bool] = Field(None, description="Whether user is active")
     roles: Optional[List[int]] = Field(None, description="List of role IDs")
 
 
-class UserResponse(BaseModel):
+class UserResponse(TrustedResponse):
     """Schema for user response"""
     id: int = Field(..., description="User ID")
     org_id: int = Field(..., description="Organization ID")
@@ -28,5 +31,4 @@ class UserResponse(BaseModel):
     updated_at: datetime = Field(..., description="Last update timestamp")
     last_login: Optional[datetime] = Field(None, description="Last login timestamp")
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
\ No newline at end of file
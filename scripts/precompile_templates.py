@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Precompile the email templates for AuthGhost API
+Writes app/templates/email_compiled.zip, which app.core.email loads instead of
+parsing the .html sources at runtime when ENVIRONMENT=production. Other
+environments always render from the .html sources.
+"""
+
+import sys
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+project_root = Path(__file__).parent.parent
+template_dir = project_root / "app" / "templates" / "email"
+target = project_root / "app" / "templates" / "email_compiled.zip"
+
+
+def main():
+    """Compile every email template into a stored (uncompressed) zip"""
+    # Autoescaping must match the environment in app/core/email.py
+    jinja_env = Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=select_autoescape(['html', 'xml'])
+    )
+    
+    try:
+        jinja_env.compile_templates(str(target), zip="stored", ignore_errors=False)
+    except Exception as e:
+        print(f"Template precompilation failed: {e}")
+        sys.exit(1)
+    
+    print(f"Compiled email templates written to {target}")
+
+
+if __name__ == "__main__":
+    main()